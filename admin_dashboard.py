@@ -4,11 +4,13 @@ Manage blog posts, categories, and content
 """
 
 import streamlit as st
+import asyncio
 import os
 from datetime import datetime, date
 from PIL import Image
 import shutil
 from database import DatabaseManager
+from async_database import AsyncDatabaseManager
 from config import UPLOAD_CONFIG, SITE_CONFIG
 from docx_converter import convert_docx_bytes_to_html, extract_excerpt_from_html
 import tempfile
@@ -28,6 +30,12 @@ def get_db_manager():
 
 db = get_db_manager()
 
+@st.cache_resource
+def get_async_db_manager():
+    return AsyncDatabaseManager(db)
+
+adb = get_async_db_manager()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -78,82 +86,93 @@ page = st.sidebar.radio("Go to", [
     "Create New Post",
     "Manage Posts",
     "Categories",
-    "Site Settings"
+    "Site Settings",
+    "Query Stats"
 ])
 
 # ==================== DASHBOARD PAGE ====================
 if page == "Dashboard":
     st.header("📊 Dashboard Overview")
     
+    # Connection test and statistics run concurrently
+    overview = asyncio.run(adb.gather(
+        connection=adb.test_connection(),
+        stats=adb.get_dashboard_stats(recent_limit=5),
+        return_exceptions=True
+    ))
+    
     # Test database connection
-    conn_status, conn_msg = db.test_connection()
+    conn_status, conn_msg = overview['connection']
     if conn_status:
         st.success(f"✅ {conn_msg}")
     else:
         st.error(f"❌ {conn_msg}")
         st.stop()
     
-    # Statistics
-    col1, col2, col3 = st.columns(3)
+    # Statistics (one query against the counters table)
+    stats = overview['stats']
+    if isinstance(stats, Exception):
+        st.error(f"Error loading statistics: {stats}")
+        stats = None
     
-    with col1:
-        try:
-            total_posts = db.get_post_count(published_only=False)
-            published_posts = db.get_post_count(published_only=True)
+    if stats:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
             st.markdown(f"""
             <div class="stat-card">
-                <h3>{total_posts}</h3>
+                <h3>{stats['total_posts']}</h3>
                 <p>Total Posts</p>
-                <small>{published_posts} published</small>
+                <small>{stats['published_posts']} published</small>
             </div>
             """, unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"Error loading post count: {e}")
-    
-    with col2:
-        try:
-            categories = db.get_unique_categories_from_posts()
+        
+        with col2:
             st.markdown(f"""
             <div class="stat-card">
-                <h3>{len(categories)}</h3>
+                <h3>{len(stats['category_counts'])}</h3>
                 <p>Categories</p>
             </div>
             """, unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"Error loading categories: {e}")
-    
-    with col3:
-        try:
-            category_counts = db.get_category_post_counts()
-            top_category = max(category_counts.items(), key=lambda x: x[1])[0] if category_counts else "N/A"
+        
+        with col3:
             st.markdown(f"""
             <div class="stat-card">
-                <h3>{top_category}</h3>
+                <h3>{stats['top_category'] or "N/A"}</h3>
                 <p>Top Category</p>
             </div>
             """, unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"Error loading top category: {e}")
-    
-    # Recent posts
-    st.subheader("Recent Posts")
-    try:
-        posts = db.get_all_posts()
-        if posts:
-            for post in posts[:5]:  # Show 5 most recent
+        
+        # Recent posts
+        st.subheader("Recent Posts")
+        if stats['recent_posts']:
+            for post in stats['recent_posts']:
                 with st.expander(f"📄 {post['title']} - {post['date']}"):
                     col1, col2 = st.columns([3, 1])
                     with col1:
                         st.write(f"**Category:** {post['category']}")
-                        st.write(f"**Excerpt:** {post['excerpt']}")
                         st.write(f"**Status:** {'✅ Published' if post['published'] else '❌ Draft'}")
                     with col2:
                         st.write(f"**ID:** {post['id']}")
                         st.write(f"**Date:** {post['date']}")
         else:
             st.info("No posts yet. Create your first post!")
-    except Exception as e:
-        st.error(f"Error loading posts: {e}")
+    
+    # Connection pool and cache usage
+    pool_stats = db.get_pool_stats()
+    if pool_stats:
+        with st.expander("🔌 Connection Pool"):
+            st.json(pool_stats)
+    
+    routing_stats = db.get_routing_stats()
+    if routing_stats:
+        with st.expander("🔀 Read Replicas"):
+            st.json(routing_stats)
+    
+    cache_stats = db.get_cache_stats()
+    if cache_stats:
+        with st.expander("⚡ Query Cache"):
+            st.json(cache_stats)
     
     # Quick actions
     st.subheader("Quick Actions")
@@ -465,21 +484,83 @@ elif page == "Manage Posts":
     st.header("📚 Manage Blog Posts")
     
     # Filter options
-    col1, col2 = st.columns([2, 1])
+    col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
-        search = st.text_input("🔍 Search posts", placeholder="Search by title...")
+        search = st.text_input("🔍 Search posts", placeholder="Search titles, excerpts and content...")
     with col2:
+        try:
+            category_options = ["All categories"] + db.get_unique_categories_from_posts()
+        except Exception:
+            category_options = ["All categories"]
+        category_filter = st.selectbox("Category", category_options)
+    with col3:
         show_unpublished = st.checkbox("Show unpublished posts", value=True)
     
+    POSTS_PER_PAGE = 20
+    selected_category = None if category_filter == "All categories" else category_filter
+    
+    # Start again from the first page whenever the filters change
+    filter_key = (search, selected_category, show_unpublished)
+    if st.session_state.get('manage_filter_key') != filter_key:
+        st.session_state.manage_filter_key = filter_key
+        st.session_state.manage_page_cursor = None
+        st.session_state.manage_search_page = 1
+    
     try:
-        # Get all posts
-        posts = db.get_all_posts(published_only=not show_unpublished)
+        page_info = None
+        search_info = None
         
-        # Filter by search
         if search:
-            posts = [p for p in posts if search.lower() in p['title'].lower()]
+            # Ranked, paginated full-text search (post metadata only)
+            search_info = db.search_posts(
+                search,
+                published_only=not show_unpublished,
+                category=selected_category,
+                page=st.session_state.manage_search_page,
+                page_size=POSTS_PER_PAGE
+            )
+            posts = search_info['posts']
+            st.write(f"**Search results** (page {search_info['page']})")
+        else:
+            # Only fetch the current page; cursor is ('after' | 'before', cursor) or None
+            page_cursor = st.session_state.manage_page_cursor
+            direction, cursor_value = page_cursor if page_cursor else (None, None)
+            page_info = db.get_post_page(
+                published_only=not show_unpublished,
+                category=selected_category,
+                page_size=POSTS_PER_PAGE,
+                after=cursor_value if direction == 'after' else None,
+                before=cursor_value if direction == 'before' else None
+            )
+            posts = page_info['posts']
+            if selected_category is None:
+                total = db.get_post_count(published_only=not show_unpublished)
+                st.write(f"**Total posts:** {total}")
         
-        st.write(f"**Total posts:** {len(posts)}")
+        # Bulk actions on the posts shown on this page
+        if posts:
+            with st.expander("🧰 Bulk actions"):
+                post_labels = {f"{p['title']} ({p['date']})": p['id'] for p in posts}
+                selected = st.multiselect("Posts", list(post_labels.keys()))
+                selected_ids = [post_labels[label] for label in selected]
+                
+                col_pub, col_unpub, col_cat = st.columns(3)
+                with col_pub:
+                    if st.button("✅ Publish", disabled=not selected_ids):
+                        changed = db.publish_posts(selected_ids)
+                        st.success(f"✅ {changed} post(s) published")
+                        st.rerun()
+                with col_unpub:
+                    if st.button("❌ Unpublish", disabled=not selected_ids):
+                        changed = db.unpublish_posts(selected_ids)
+                        st.success(f"✅ {changed} post(s) moved to drafts")
+                        st.rerun()
+                with col_cat:
+                    move_to = st.text_input("Move to category", key="bulk_category")
+                    if st.button("🏷️ Move", disabled=not (selected_ids and move_to)):
+                        changed = db.recategorize_posts(selected_ids, move_to)
+                        st.success(f"✅ {changed} post(s) moved to {move_to}")
+                        st.rerun()
         
         # Display posts
         for post in posts:
@@ -504,21 +585,24 @@ elif page == "Manage Posts":
                         col_save, col_delete = st.columns(2)
                         with col_save:
                             if st.form_submit_button("💾 Save Changes"):
-                                try:
-                                    db.update_post(
-                                        post_id=post['id'],
-                                        title=new_title,
-                                        excerpt=new_excerpt,
-                                        content=post['content'],  # Keep original content
-                                        category=new_category,
-                                        image_path=post['image_path'],
-                                        date=new_date.strftime('%Y-%m-%d'),
-                                        published=new_published
-                                    )
-                                    st.success("✅ Post updated!")
-                                    st.rerun()
-                                except Exception as e:
-                                    st.error(f"Error: {e}")
+                                # Only send the fields that changed (the content is never rewritten here)
+                                edited = {
+                                    'title': new_title,
+                                    'excerpt': new_excerpt,
+                                    'category': new_category,
+                                    'date': new_date.strftime('%Y-%m-%d'),
+                                    'published': new_published
+                                }
+                                changes = {k: v for k, v in edited.items() if v != post[k]}
+                                if not changes:
+                                    st.info("No changes to save")
+                                else:
+                                    try:
+                                        db.patch_post(post['id'], **changes)
+                                        st.success("✅ Post updated!")
+                                        st.rerun()
+                                    except Exception as e:
+                                        st.error(f"Error: {e}")
                         
                         with col_delete:
                             if st.form_submit_button("🗑️ Delete Post"):
@@ -535,6 +619,28 @@ elif page == "Manage Posts":
                             st.image(post['image_path'], caption="Header Image", width=300)
                         except:
                             st.caption(f"Image: {post['image_path']}")
+        
+        # Page navigation
+        if page_info:
+            col_prev, col_next = st.columns(2)
+            with col_prev:
+                if st.button("← Previous", disabled=page_info['prev_cursor'] is None):
+                    st.session_state.manage_page_cursor = ('before', page_info['prev_cursor'])
+                    st.rerun()
+            with col_next:
+                if st.button("Next →", disabled=page_info['next_cursor'] is None):
+                    st.session_state.manage_page_cursor = ('after', page_info['next_cursor'])
+                    st.rerun()
+        elif search_info:
+            col_prev, col_next = st.columns(2)
+            with col_prev:
+                if st.button("← Previous", disabled=search_info['page'] <= 1):
+                    st.session_state.manage_search_page -= 1
+                    st.rerun()
+            with col_next:
+                if st.button("Next →", disabled=not search_info['has_next']):
+                    st.session_state.manage_search_page += 1
+                    st.rerun()
     
     except Exception as e:
         st.error(f"Error loading posts: {e}")
@@ -546,18 +652,18 @@ elif page == "Categories":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.subheader("Categories in Use")
+        st.subheader("Categories")
         try:
-            categories = db.get_unique_categories_from_posts()
-            category_counts = db.get_category_post_counts()
+            categories = db.get_all_categories()
             
             if categories:
                 for cat in categories:
-                    count = category_counts.get(cat, 0)
-                    st.write(f"📁 **{cat}** ({count} posts)")
+                    drafts = f", {cat['draft_count']} drafts" if cat['draft_count'] else ""
+                    st.write(f"📁 **{cat['name']}** ({cat['published_count']} posts{drafts})")
             else:
                 st.info("No categories yet. Create a post to add categories.")
         except Exception as e:
+            categories = []
             st.error(f"Error loading categories: {e}")
     
     with col2:
@@ -576,6 +682,24 @@ elif page == "Categories":
                         st.error(f"Error: {e}")
                 else:
                     st.error("Please enter a category name")
+        
+        if categories:
+            st.subheader("Rename Category")
+            with st.form("rename_category_form"):
+                names = {cat['name']: cat['id'] for cat in categories}
+                rename_from = st.selectbox("Category", list(names))
+                rename_to = st.text_input("New Name")
+                
+                if st.form_submit_button("Rename Category"):
+                    if rename_to:
+                        try:
+                            db.rename_category(names[rename_from], rename_to)
+                            st.success(f"✅ Renamed '{rename_from}' to '{rename_to}'")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error: {e}")
+                    else:
+                        st.error("Please enter a new name")
 
 # ==================== SITE SETTINGS PAGE ====================
 elif page == "Site Settings":
@@ -626,12 +750,14 @@ elif page == "Site Settings":
             
             if st.form_submit_button("💾 Save Settings"):
                 try:
-                    db.update_site_config('site_title', site_title)
-                    db.update_site_config('site_tagline', site_tagline)
-                    db.update_site_config('footer_text', footer_text)
-                    db.update_site_config('acknowledgment', acknowledgment)
-                    db.update_site_config('primary_color', primary_color)
-                    db.update_site_config('accent_color', accent_color)
+                    db.update_site_configs({
+                        'site_title': site_title,
+                        'site_tagline': site_tagline,
+                        'footer_text': footer_text,
+                        'acknowledgment': acknowledgment,
+                        'primary_color': primary_color,
+                        'accent_color': accent_color
+                    })
                     
                     st.success("✅ Settings saved successfully!")
                     st.rerun()
@@ -645,6 +771,57 @@ elif page == "Site Settings":
     except Exception as e:
         st.error(f"Error loading settings: {e}")
 
+# ==================== QUERY STATS PAGE ====================
+elif page == "Query Stats":
+    st.header("🔍 Query Stats")
+    
+    query_stats = db.get_query_stats()
+    if query_stats is None:
+        st.info("Query statistics are disabled. Set QUERY_STATS_CONFIG['enabled'] = True in config.py.")
+    else:
+        st.caption("Database calls made by this app since it started (or since the last reset), "
+                   "busiest methods first. Cached reads are not counted.")
+        
+        methods = query_stats['methods']
+        if methods:
+            st.dataframe([
+                {
+                    'Method': name,
+                    'Calls': counters['calls'],
+                    'Errors': counters['errors'],
+                    'Total ms': counters['total_ms'],
+                    'Avg ms': counters['avg_ms'],
+                    'Max ms': counters['max_ms'],
+                    'Statements': counters['statements'],
+                    'Rows': counters['rows'],
+                    'KB sent': round(counters['bytes_sent'] / 1024, 1),
+                    'KB received': round(counters['bytes_received'] / 1024, 1)
+                }
+                for name, counters in methods.items()
+            ], use_container_width=True, hide_index=True)
+            
+            selected_method = st.selectbox("Latency histogram", list(methods))
+            st.bar_chart(methods[selected_method]['histogram'])
+        else:
+            st.info("No database calls recorded yet.")
+        
+        st.subheader(f"Slow Queries (≥ {query_stats['slow_query_ms']:g} ms)")
+        if query_stats['slow_queries']:
+            for entry in query_stats['slow_queries']:
+                with st.expander(f"{entry['ms']} ms · {entry['method']} · {entry['at']}"):
+                    st.code(entry['query'], language="sql")
+        else:
+            st.success("No slow queries logged.")
+        
+        pool_stats = db.get_pool_stats()
+        if pool_stats:
+            st.caption(f"Prepared statements: {pool_stats['statements_prepared']} prepared, "
+                       f"{pool_stats['statements_reused']} reused")
+        
+        if st.button("🔄 Reset Stats"):
+            db.reset_query_stats()
+            st.rerun()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📝 Blog Admin Dashboard")
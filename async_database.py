@@ -0,0 +1,63 @@
+"""
+Asyncio API for blog database operations
+Runs DatabaseManager methods on a bounded thread pool so independent reads can be awaited together
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Dict
+from database import DatabaseManager
+
+
+# Worker threads when the DatabaseManager has no connection pool to size them by
+DEFAULT_MAX_WORKERS = 4
+
+# DatabaseManager methods that can't be moved to a worker thread:
+# transaction() is bound to the calling thread and iter_posts() streams on the caller's thread
+SYNC_ONLY_METHODS = {'transaction', 'in_transaction', 'iter_posts', 'get_connection'}
+
+
+class AsyncDatabaseManager:
+    """
+    Awaitable versions of the DatabaseManager methods.
+
+        adb = AsyncDatabaseManager(db)
+        stats = await adb.get_dashboard_stats()
+        results = await adb.gather(posts=adb.get_post_summaries(), config=adb.get_all_site_config())
+
+    Each call runs the regular method on a worker thread with its own pooled
+    connection. There are as many workers as pooled connections, so concurrent
+    calls never wait on each other for a connection.
+    """
+
+    def __init__(self, db: DatabaseManager = None, max_workers: int = None):
+        self.db = db or DatabaseManager()
+        if max_workers is None:
+            max_workers = self.db.pool.pool_size if self.db.pool else DEFAULT_MAX_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db')
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+        if name.startswith('_') or name in SYNC_ONLY_METHODS or not callable(method):
+            raise AttributeError(f"{type(self).__name__} has no async version of {name!r}")
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+        return call
+
+    async def gather(self, return_exceptions: bool = False, **calls: Awaitable) -> Dict:
+        """
+        Await several calls concurrently and return their results under the same names.
+
+        With return_exceptions=True a failed call's exception is returned in its
+        place instead of being raised, so each result can be handled on its own.
+        """
+        results = await asyncio.gather(*calls.values(), return_exceptions=return_exceptions)
+        return dict(zip(calls.keys(), results))
+
+    def close(self):
+        """Stop the worker threads (the DatabaseManager stays usable)"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,342 @@
+"""
+Storage backends for DatabaseManager
+MySQL (a server, through mysql.connector) or SQLite (a local file in WAL mode)
+"""
+
+import abc
+import functools
+import os
+import re
+import sqlite3
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import mysql.connector
+    from mysql.connector import Error as MySQLError
+except ImportError:
+    mysql = None
+    MySQLError = None
+
+
+# Exceptions raised by whichever database drivers are installed
+DB_ERRORS = tuple(error for error in (MySQLError, sqlite3.Error) if error is not None)
+
+# InnoDB full-text defaults: shorter words and the stopwords below are never indexed, so
+# MySQL search matches them with LIKE instead. Keep in step with the server's
+# innodb_ft_min_token_size and innodb_ft_server_stopword_table if those are changed
+MYSQL_FT_MIN_TOKEN_SIZE = 3
+MYSQL_FT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how',
+    'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what',
+    'when', 'where', 'who', 'will', 'with', 'und', 'www'
+))
+
+# Schema used by SQLiteBackend (the SQLite counterpart of create_tables.sql)
+SQLITE_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'create_tables_sqlite.sql')
+
+
+def _values_lists(columns: int, rows: int) -> str:
+    """Placeholder lists for a multi-row VALUES clause: (%s, %s), (%s, %s), ..."""
+    return ', '.join([f"({', '.join(['%s'] * columns)})"] * rows)
+
+
+class Backend(abc.ABC):
+    """
+    One database engine behind DatabaseManager.
+
+    DatabaseManager writes MySQL-flavoured SQL with %s placeholders; a backend
+    opens connections that accept it and builds the few statements whose syntax
+    differs between engines (upserts, INSERT IGNORE, full-text search, date math).
+    """
+
+    name = ''
+    label = ''
+
+    @abc.abstractmethod
+    def connect(self):
+        """Open a new connection with the mysql.connector connection/cursor API"""
+
+    @abc.abstractmethod
+    def upsert_sql(self, table: str, columns: Sequence[str], key_columns: Sequence[str],
+                   update_columns: Sequence[str] = (), assignments: Optional[Dict[str, str]] = None,
+                   rows: int = 1) -> str:
+        """
+        INSERT `rows` rows, or update the existing rows with the same key.
+
+        update_columns take the inserted values; `assignments` maps further
+        columns to SQL expressions (e.g. {'deleted_at': 'CURRENT_TIMESTAMP'}).
+        """
+
+    @abc.abstractmethod
+    def insert_ignore_sql(self, table: str, columns: Sequence[str]) -> str:
+        """INSERT a row unless one with the same unique key exists"""
+
+    @abc.abstractmethod
+    def days_ago_sql(self) -> str:
+        """Expression for the current time minus %s days"""
+
+    @abc.abstractmethod
+    def fulltext_terms(self, search: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Split free text into (word, full-text query) pairs, the query matching the word
+        as a prefix ([] if no words). The query is None for words the full-text index
+        never holds (too short, stopwords); search matches those with LIKE.
+        """
+
+    @abc.abstractmethod
+    def fulltext_hits(self, index: str, table: str, key_column: str, columns: Sequence[str],
+                      query: str) -> Tuple[str, List]:
+        """
+        SELECT (post_id, score) for the rows of `table` matching a fulltext_terms() term
+        through the full-text index named `index`; returns (sql, params).
+        """
+
+
+class MySQLBackend(Backend):
+    """MySQL server through mysql.connector, configured by DB_CONFIG"""
+
+    name = 'mysql'
+    label = 'MySQL'
+
+    def __init__(self, db_config: Dict):
+        if mysql is None:
+            raise ImportError("The MySQL backend needs mysql-connector-python (pip install mysql-connector-python)")
+        self.db_config = db_config
+
+    def connect(self):
+        return mysql.connector.connect(**self.db_config)
+
+    def upsert_sql(self, table, columns, key_columns, update_columns=(), assignments=None, rows=1) -> str:
+        updates = [f"{column} = VALUES({column})" for column in update_columns]
+        updates += [f"{column} = {expression}" for column, expression in (assignments or {}).items()]
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {_values_lists(len(columns), rows)} "
+            f"ON DUPLICATE KEY UPDATE {', '.join(updates)}"
+        )
+
+    def insert_ignore_sql(self, table, columns) -> str:
+        return f"INSERT IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+    def days_ago_sql(self) -> str:
+        return "NOW() - INTERVAL %s DAY"
+
+    def fulltext_terms(self, search: str) -> List[Tuple[str, Optional[str]]]:
+        # Drop characters that have a meaning in boolean mode
+        words = re.sub(r'[+\-<>()~*"@]', ' ', search or '').split()
+        return [
+            (word, None if len(word) < MYSQL_FT_MIN_TOKEN_SIZE or word.lower() in MYSQL_FT_STOPWORDS
+             else f"+{word}*")
+            for word in words
+        ]
+
+    def fulltext_hits(self, index, table, key_column, columns, query) -> Tuple[str, List]:
+        match = f"MATCH({', '.join(columns)}) AGAINST (%s IN BOOLEAN MODE)"
+        return f"SELECT {key_column} AS post_id, {match} AS score FROM {table} WHERE {match}", [query, query]
+
+
+class SQLiteBackend(Backend):
+    """
+    Embedded SQLite database file in WAL mode, configured by SQLITE_CONFIG.
+
+    WAL lets readers run alongside the single writer, so both Streamlit apps can
+    share one file. The schema (create_tables_sqlite.sql) is applied on startup.
+    """
+
+    name = 'sqlite'
+    label = 'SQLite'
+
+    def __init__(self, path: str = 'blog.db', timeout: float = 5.0, initialize: bool = True):
+        self.path = path
+        self.timeout = timeout
+        if initialize:
+            self._initialize()
+
+    def _initialize(self):
+        """Switch the file to WAL mode and create any missing tables"""
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        try:
+            # journal_mode is stored in the file, so this only has to happen once
+            connection.execute("PRAGMA journal_mode = WAL")
+            with open(SQLITE_SCHEMA_PATH, encoding='utf-8') as f:
+                connection.executescript(f.read())
+        finally:
+            connection.close()
+
+    def connect(self):
+        return SQLiteConnection(self.path, self.timeout)
+
+    def upsert_sql(self, table, columns, key_columns, update_columns=(), assignments=None, rows=1) -> str:
+        updates = [f"{column} = excluded.{column}" for column in update_columns]
+        updates += [f"{column} = {expression}" for column, expression in (assignments or {}).items()]
+        return (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {_values_lists(len(columns), rows)} "
+            f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {', '.join(updates)}"
+        )
+
+    def insert_ignore_sql(self, table, columns) -> str:
+        return f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+    def days_ago_sql(self) -> str:
+        return "datetime('now', '-' || %s || ' days')"
+
+    def fulltext_terms(self, search: str) -> List[Tuple[str, Optional[str]]]:
+        # Quote every word so FTS5 operators in the text are taken literally; FTS5
+        # indexes every token, so no word needs the LIKE fallback
+        words = re.sub(r'[+\-<>()~*"@^:]', ' ', search or '').split()
+        return [(word, f'"{word}"*') for word in words]
+
+    def fulltext_hits(self, index, table, key_column, columns, query) -> Tuple[str, List]:
+        # The FTS5 table is named after the MySQL index and shares the rowid of `table`;
+        # bm25() is lower for better matches
+        return f"SELECT rowid AS post_id, -bm25({index}) AS score FROM {index} WHERE {index} MATCH %s", [query]
+
+
+def create_backend(name: str, db_config: Dict, sqlite_config: Dict) -> Backend:
+    """Build the backend selected by DB_BACKEND"""
+    if name == 'mysql':
+        return MySQLBackend(db_config)
+    if name == 'sqlite':
+        return SQLiteBackend(**sqlite_config)
+    raise ValueError(f"Unknown database backend {name!r} (expected 'mysql' or 'sqlite')")
+
+
+# ==================== SQLite adapter ====================
+# Just enough of the mysql.connector API for DatabaseManager and ConnectionPool.
+
+def _date_format(value, fmt):
+    """DATE_FORMAT() for SQLite (MySQL and strftime agree on %Y, %m and %d)"""
+    if value is None:
+        return None
+    return datetime.fromisoformat(str(value)).strftime(fmt)
+
+
+# Store dates/timestamps as the text SQLite's own CURRENT_TIMESTAMP produces, and read
+# DATE/TIMESTAMP columns back as the objects mysql.connector would return
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()[:10]))
+
+_WRITE_STATEMENT = re.compile(r'^\s*(INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+_FOR_UPDATE = re.compile(r'\s+FOR\s+UPDATE\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _translate(query: str) -> Tuple[str, bool]:
+    """Rewrite a statement for sqlite3; returns (sql, needs_write_lock)"""
+    locking = bool(_FOR_UPDATE.search(query))
+    sql = _FOR_UPDATE.sub('', query).replace('%s', '?')
+    return sql, locking or bool(_WRITE_STATEMENT.match(sql))
+
+
+class SQLiteConnection:
+    """sqlite3 connection that behaves like a mysql.connector connection (autocommit off)"""
+
+    def __init__(self, path: str, timeout: float):
+        # Transactions are managed here: BEGIN IMMEDIATE before the first write or
+        # SELECT ... FOR UPDATE, like InnoDB taking its locks
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None,
+            detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        # Safe with WAL: a crash can lose the last commits but never corrupts the file
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.create_function('DATE_FORMAT', 2, _date_format, deterministic=True)
+
+    def cursor(self, dictionary: bool = False, buffered: bool = True, prepared: bool = False,
+               **kwargs) -> 'SQLiteCursor':
+        # sqlite3 cursors already fetch lazily, so buffered makes no difference, and every
+        # connection keeps its compiled statements cached, so prepared does not either
+        return SQLiteCursor(self, dictionary)
+
+    def _begin(self):
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+    def start_transaction(self):
+        self._begin()
+
+    def commit(self):
+        if self._connection.in_transaction:
+            self._connection.execute("COMMIT")
+
+    def rollback(self):
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+
+    def consume_results(self):
+        pass
+
+    def ping(self, reconnect: bool = False):
+        self._connection.execute("SELECT 1")
+
+    def is_connected(self) -> bool:
+        try:
+            self.ping()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self):
+        self._connection.close()
+
+
+class SQLiteCursor:
+    """sqlite3 cursor with mysql.connector's %s placeholders, dictionary rows and lastrowid"""
+
+    def __init__(self, connection: SQLiteConnection, dictionary: bool):
+        self._connection = connection
+        self._cursor = connection._connection.cursor()
+        self._dictionary = dictionary
+        self.lastrowid = None
+        self.rowcount = -1
+
+    def execute(self, query: str, params=None):
+        sql, locking = _translate(query)
+        if locking:
+            self._connection._begin()
+        self._cursor.execute(sql, tuple(params or ()))
+        self.lastrowid = self._cursor.lastrowid
+        self.rowcount = self._cursor.rowcount
+
+    def executemany(self, query: str, seq_params):
+        # Row by row inside the transaction (no round trips to save), so that lastrowid
+        # is the first inserted id like a multi-row INSERT in MySQL
+        sql, locking = _translate(query)
+        if locking:
+            self._connection._begin()
+        first_id = None
+        rowcount = 0
+        for params in seq_params:
+            self._cursor.execute(sql, tuple(params))
+            if first_id is None:
+                first_id = self._cursor.lastrowid
+            rowcount += max(self._cursor.rowcount, 0)
+        self.lastrowid = first_id
+        self.rowcount = rowcount
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column[0] for column in self._cursor.description or ())
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1):
+        return [self._row(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return (self._row(row) for row in self._cursor)
+
+    def close(self):
+        self._cursor.close()
@@ -17,6 +17,73 @@ DB_CONFIG = {
     'port': 3306                   # MySQL port (default: 3306)
 }
 
+# ==============================================
+# STORAGE BACKEND
+# ==============================================
+# 'mysql' uses DB_CONFIG above; 'sqlite' keeps everything in a local file
+# (WAL mode, tables created automatically) and needs no database server
+
+DB_BACKEND = 'mysql'
+
+SQLITE_CONFIG = {
+    'path': 'blog.db',             # Database file (created on first run)
+    'timeout': 5                   # Seconds to wait while another process is writing
+}
+
+# ==============================================
+# CONNECTION POOL CONFIGURATION
+# ==============================================
+# Reuse database connections instead of opening a new one for every query
+
+POOL_CONFIG = {
+    'enabled': True,               # Set to False to connect per query
+    'pool_size': 5,                # Maximum open connections
+    'checkout_timeout': 10,        # Seconds to wait for a free connection
+    'health_check_interval': 30,   # Ping connections idle longer than this (seconds)
+    'max_prepared_statements': 32  # Prepared statements kept per connection (0 = off)
+}
+
+# ==============================================
+# READ REPLICAS
+# ==============================================
+# Send reads (posts, counts, categories, settings) to one or more replicas
+# and keep writes on the primary above. Each endpoint only lists what
+# differs from DB_CONFIG (or SQLITE_CONFIG), e.g. {'host': 'replica1'} or
+# {'port': 3307}. For `read_your_writes` seconds after this app writes,
+# its reads go to the primary so edits show up immediately.
+
+REPLICA_CONFIG = {
+    'endpoints': [],               # e.g. [{'host': 'replica1'}, {'host': 'replica2'}]
+    'read_your_writes': 5          # Seconds to read from the primary after a write
+}
+
+# ==============================================
+# QUERY CACHE CONFIGURATION
+# ==============================================
+# Keep small, rarely changing reads (site settings, categories, counts,
+# single posts) in memory. Off by default: writes made through the app clear
+# its own cache, but changes made by the other app (admin dashboard vs. site
+# generator) can stay hidden for up to `ttl` seconds. Turn it on when fewer
+# database reads matter more than seeing the other app's edits right away.
+
+CACHE_CONFIG = {
+    'enabled': False,              # True to serve repeated reads from memory
+    'max_entries': 256,            # Least recently used entries are evicted first
+    'ttl': 60                      # Seconds before an entry expires
+}
+
+# ==============================================
+# QUERY STATISTICS
+# ==============================================
+# Per-method call counts, latency histograms, rows/bytes and a slow query
+# log, shown on the admin dashboard's "Query Stats" page
+
+QUERY_STATS_CONFIG = {
+    'enabled': True,
+    'slow_query_ms': 200,          # Log statements slower than this
+    'slow_log_size': 50            # Slow queries kept (oldest dropped first)
+}
+
 # ==============================================
 # SITE CONFIGURATION
 # ==============================================
@@ -65,6 +132,13 @@ OUTPUT_CONFIG = {
     # Folder where generated HTML files are saved
     'output_folder': 'output',
     
+    # Post cards per index page (index.html, then page/2.html, page/3.html, ...)
+    'posts_per_page': 12,
+    
+    # Search box on the listing pages; writes posts-index.json (card metadata)
+    # and content/<id>-<hash>.json (one per post), fetched only when used
+    'client_search': True,
+    
     # Template folder (for future expansion)
     'template_folder': 'templates'
 }
@@ -8,33 +8,16 @@ USE FCS3;
 -- Drop existing table if you want to start fresh (CAUTION: This deletes all data!)
 -- DROP TABLE IF EXISTS blog_posts;
 
--- Create blog_posts table
-CREATE TABLE IF NOT EXISTS blog_posts (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-    title VARCHAR(255) NOT NULL,
-    excerpt TEXT NOT NULL,
-    content LONGTEXT NOT NULL,
-    category VARCHAR(100) NOT NULL,
-    image_path VARCHAR(500) NOT NULL,
-    date DATE NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    published BOOLEAN DEFAULT TRUE,
-    sort_order INT DEFAULT 0,
-    
-    INDEX idx_category (category),
-    INDEX idx_date (date),
-    INDEX idx_published (published),
-    INDEX idx_sort_order (sort_order)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-
--- Create categories table (for managing categories)
+-- Create categories table (posts reference it by id)
 CREATE TABLE IF NOT EXISTS categories (
     id INT AUTO_INCREMENT PRIMARY KEY,
     name VARCHAR(100) NOT NULL UNIQUE,
     description TEXT,
     display_order INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Post counters kept current by the app on every post write
+    published_count INT NOT NULL DEFAULT 0,
+    draft_count INT NOT NULL DEFAULT 0,
     
     INDEX idx_name (name),
     INDEX idx_display_order (display_order)
@@ -47,6 +30,64 @@ INSERT IGNORE INTO categories (name, description, display_order) VALUES
     ('Case Studies', 'Real-world examples and success stories', 3),
     ('Best Practices', 'Guidelines and recommendations', 4);
 
+-- Create blog_posts table
+CREATE TABLE IF NOT EXISTS blog_posts (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    excerpt TEXT NOT NULL,
+    category_id INT NOT NULL,
+    image_path VARCHAR(500) NOT NULL,
+    date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    published BOOLEAN DEFAULT TRUE,
+    sort_order INT DEFAULT 0,
+    -- SHA-256 hashes maintained by DatabaseManager for cheap change detection
+    content_hash CHAR(64) NULL,
+    metadata_hash CHAR(64) NULL,
+    
+    -- Composite indexes match the listing order (date, sort_order, id, newest first)
+    INDEX idx_listing (date, sort_order, id),
+    INDEX idx_published_listing (published, date, sort_order, id),
+    INDEX idx_category_listing (category_id, published, date, sort_order, id),
+    INDEX idx_category_date (category_id, date, sort_order, id),
+    -- Change feed: posts created/updated since a watermark
+    INDEX idx_updated_at (updated_at),
+    INDEX idx_content_hash (content_hash),
+    -- InnoDB leaves words shorter than innodb_ft_min_token_size (default 3) and stopwords
+    -- out of FULLTEXT indexes; search_posts() matches those (e.g. "AI") with LIKE. To index
+    -- them, set innodb_ft_min_token_size in my.cnf, restart, rebuild both FULLTEXT indexes
+    -- and update MYSQL_FT_MIN_TOKEN_SIZE in backends.py
+    FULLTEXT INDEX ft_posts (title, excerpt),
+    CONSTRAINT fk_posts_category FOREIGN KEY (category_id) REFERENCES categories (id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Create blog_post_bodies table (post content kept apart so blog_posts rows stay narrow)
+-- For compressed storage, add ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8 to the table options
+CREATE TABLE IF NOT EXISTS blog_post_bodies (
+    post_id INT NOT NULL PRIMARY KEY,
+    content LONGTEXT NOT NULL,
+    
+    FULLTEXT INDEX ft_post_bodies (content),
+    CONSTRAINT fk_post_bodies_post FOREIGN KEY (post_id) REFERENCES blog_posts (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Create deleted_posts table (tombstones so the change feed can report deletes)
+CREATE TABLE IF NOT EXISTS deleted_posts (
+    post_id INT NOT NULL PRIMARY KEY,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    
+    INDEX idx_deleted_at (deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Create content_version table (one row, bumped after every write so apps can tell when to refetch)
+CREATE TABLE IF NOT EXISTS content_version (
+    id TINYINT UNSIGNED NOT NULL PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB;
+
+INSERT IGNORE INTO content_version (id, version) VALUES (1, 0);
+
 -- Create site_config table (for storing site settings)
 CREATE TABLE IF NOT EXISTS site_config (
     id INT AUTO_INCREMENT PRIMARY KEY,
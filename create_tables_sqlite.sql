@@ -0,0 +1,147 @@
+-- ============================================
+-- AI Education Blog - SQLite Database Setup
+-- Same tables as create_tables.sql, for DB_BACKEND = 'sqlite'.
+-- DatabaseManager applies this automatically; every statement is idempotent.
+-- ============================================
+
+-- Create categories table (posts reference it by id)
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    description TEXT,
+    display_order INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Post counters kept current by the app on every post write
+    published_count INTEGER NOT NULL DEFAULT 0,
+    draft_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_display_order ON categories (display_order);
+
+-- Insert some default categories (optional)
+INSERT OR IGNORE INTO categories (name, description, display_order) VALUES
+    ('Teaching Tools', 'Tools and resources for educators', 1),
+    ('AI Research', 'Latest research in AI and education', 2),
+    ('Case Studies', 'Real-world examples and success stories', 3),
+    ('Best Practices', 'Guidelines and recommendations', 4);
+
+-- Create blog_posts table
+CREATE TABLE IF NOT EXISTS blog_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    excerpt TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories (id),
+    image_path TEXT NOT NULL,
+    date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    published BOOLEAN DEFAULT TRUE,
+    sort_order INTEGER DEFAULT 0,
+    -- SHA-256 hashes maintained by DatabaseManager for cheap change detection
+    content_hash CHAR(64),
+    metadata_hash CHAR(64)
+);
+
+-- Composite indexes match the listing order (date, sort_order, id, newest first)
+CREATE INDEX IF NOT EXISTS idx_listing ON blog_posts (date, sort_order, id);
+CREATE INDEX IF NOT EXISTS idx_published_listing ON blog_posts (published, date, sort_order, id);
+CREATE INDEX IF NOT EXISTS idx_category_listing ON blog_posts (category_id, published, date, sort_order, id);
+CREATE INDEX IF NOT EXISTS idx_category_date ON blog_posts (category_id, date, sort_order, id);
+-- Change feed: posts created/updated since a watermark
+CREATE INDEX IF NOT EXISTS idx_updated_at ON blog_posts (updated_at);
+CREATE INDEX IF NOT EXISTS idx_content_hash ON blog_posts (content_hash);
+
+-- MySQL's ON UPDATE CURRENT_TIMESTAMP
+CREATE TRIGGER IF NOT EXISTS blog_posts_updated_at AFTER UPDATE ON blog_posts
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE blog_posts SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+-- Create blog_post_bodies table (post content kept apart so blog_posts rows stay narrow)
+CREATE TABLE IF NOT EXISTS blog_post_bodies (
+    post_id INTEGER PRIMARY KEY REFERENCES blog_posts (id) ON DELETE CASCADE,
+    content TEXT NOT NULL
+);
+
+-- Full-text indexes (FTS5 tables named after the MySQL FULLTEXT indexes),
+-- kept in step with their tables by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS ft_posts USING fts5(
+    title, excerpt, content='blog_posts', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS ft_posts_insert AFTER INSERT ON blog_posts
+BEGIN
+    INSERT INTO ft_posts (rowid, title, excerpt) VALUES (NEW.id, NEW.title, NEW.excerpt);
+END;
+
+CREATE TRIGGER IF NOT EXISTS ft_posts_delete AFTER DELETE ON blog_posts
+BEGIN
+    INSERT INTO ft_posts (ft_posts, rowid, title, excerpt) VALUES ('delete', OLD.id, OLD.title, OLD.excerpt);
+END;
+
+CREATE TRIGGER IF NOT EXISTS ft_posts_update AFTER UPDATE OF title, excerpt ON blog_posts
+BEGIN
+    INSERT INTO ft_posts (ft_posts, rowid, title, excerpt) VALUES ('delete', OLD.id, OLD.title, OLD.excerpt);
+    INSERT INTO ft_posts (rowid, title, excerpt) VALUES (NEW.id, NEW.title, NEW.excerpt);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS ft_post_bodies USING fts5(
+    content, content='blog_post_bodies', content_rowid='post_id'
+);
+
+CREATE TRIGGER IF NOT EXISTS ft_post_bodies_insert AFTER INSERT ON blog_post_bodies
+BEGIN
+    INSERT INTO ft_post_bodies (rowid, content) VALUES (NEW.post_id, NEW.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS ft_post_bodies_delete AFTER DELETE ON blog_post_bodies
+BEGIN
+    INSERT INTO ft_post_bodies (ft_post_bodies, rowid, content) VALUES ('delete', OLD.post_id, OLD.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS ft_post_bodies_update AFTER UPDATE OF content ON blog_post_bodies
+BEGIN
+    INSERT INTO ft_post_bodies (ft_post_bodies, rowid, content) VALUES ('delete', OLD.post_id, OLD.content);
+    INSERT INTO ft_post_bodies (rowid, content) VALUES (NEW.post_id, NEW.content);
+END;
+
+-- Create deleted_posts table (tombstones so the change feed can report deletes)
+CREATE TABLE IF NOT EXISTS deleted_posts (
+    post_id INTEGER PRIMARY KEY,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_at ON deleted_posts (deleted_at);
+
+-- Create content_version table (one row, bumped after every write so apps can tell when to refetch)
+CREATE TABLE IF NOT EXISTS content_version (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO content_version (id, version) VALUES (1, 0);
+
+-- Create site_config table (for storing site settings)
+CREATE TABLE IF NOT EXISTS site_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    config_key TEXT NOT NULL UNIQUE,
+    config_value TEXT,
+    description TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS site_config_updated_at AFTER UPDATE ON site_config
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE site_config SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+-- Insert default site configuration
+INSERT OR IGNORE INTO site_config (config_key, config_value, description) VALUES
+    ('site_title', 'AI in Education', 'Main site title'),
+    ('site_tagline', 'Exploring the intersection of artificial intelligence and learning', 'Site tagline/subtitle'),
+    ('footer_text', '© 2026, Dylan A. Bulseco, Ph.D., AI in Education Blog. All rights reserved.', 'Footer copyright text'),
+    ('logo_path', '/images/logo.png', 'Path to site logo'),
+    ('primary_color', '#2c3e50', 'Primary theme color'),
+    ('accent_color', '#3498db', 'Accent theme color');
@@ -2,26 +2,999 @@
 Database utility functions for blog operations
 """
 
-import mysql.connector
-from mysql.connector import Error
+import functools
+import hashlib
+import inspect
+import itertools
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from backends import DB_ERRORS, Backend, create_backend
 from config import DB_CONFIG
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from config import DB_BACKEND
+except ImportError:
+    DB_BACKEND = 'mysql'
+
+try:
+    from config import SQLITE_CONFIG
+except ImportError:
+    SQLITE_CONFIG = {}
+
+try:
+    from config import POOL_CONFIG
+except ImportError:
+    POOL_CONFIG = {}
+
+try:
+    from config import CACHE_CONFIG
+except ImportError:
+    CACHE_CONFIG = {}
+
+try:
+    from config import QUERY_STATS_CONFIG
+except ImportError:
+    QUERY_STATS_CONFIG = {}
+
+try:
+    from config import REPLICA_CONFIG
+except ImportError:
+    REPLICA_CONFIG = {}
+
+
+# Defaults used when config.py has no SQLITE_CONFIG (only read when DB_BACKEND = 'sqlite')
+DEFAULT_SQLITE_CONFIG = {
+    'path': 'blog.db',
+    'timeout': 5.0
+}
+
+# Defaults used when config.py has no POOL_CONFIG (or leaves keys out)
+DEFAULT_POOL_CONFIG = {
+    'enabled': True,
+    'pool_size': 5,
+    'checkout_timeout': 10.0,
+    'health_check_interval': 30.0,
+    'max_prepared_statements': 32
+}
+
+# Defaults used when config.py has no CACHE_CONFIG (the cache is opt-in)
+DEFAULT_CACHE_CONFIG = {
+    'enabled': False,
+    'max_entries': 256,
+    'ttl': 60.0
+}
+
+# Defaults used when config.py has no QUERY_STATS_CONFIG
+DEFAULT_QUERY_STATS_CONFIG = {
+    'enabled': True,
+    'slow_query_ms': 200.0,
+    'slow_log_size': 50
+}
+
+# Defaults used when config.py has no REPLICA_CONFIG (no replicas: everything uses the primary)
+DEFAULT_REPLICA_CONFIG = {
+    'endpoints': [],
+    'read_your_writes': 5.0
+}
+
+# Upper bounds (ms) of the latency histogram buckets; slower calls land in a final '+inf' bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class PooledConnection:
+    """Wrap a pooled connection so that close() hands it back to the pool"""
+    
+    def __init__(self, pool: 'ConnectionPool', connection):
+        self._pool = pool
+        self._connection = connection
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+    
+    def prepared_cursor(self, query: str):
+        """Cursor holding a server-side prepared statement for `query`, reused across checkouts"""
+        return self._pool.prepared_cursor(self._connection, query)
+    
+    def close(self):
+        """Return the connection to the pool instead of closing it"""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool._release(connection)
+    
+    def __del__(self):
+        # Safety net for callers that raise before reaching close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Small thread-safe pool of connections opened by a storage backend"""
+    
+    def __init__(self, backend: Backend, pool_size: int = 5, checkout_timeout: float = 10.0,
+                 health_check_interval: float = 30.0, max_prepared_statements: int = 32):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        
+        self.backend = backend
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.max_prepared_statements = max_prepared_statements
+        
+        self._idle = []  # (connection, last_used) pairs, most recently used last
+        self._statements = {}  # id(connection) -> OrderedDict of query -> prepared cursor, LRU first
+        self._open = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            'connections_created': 0,
+            'checkouts': 0,
+            'reused': 0,
+            'health_checks': 0,
+            'discarded': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'wait_time_total': 0.0,
+            'peak_in_use': 0,
+            'statements_prepared': 0,
+            'statements_reused': 0
+        }
+    
+    def _connect(self):
+        """Open a brand new connection"""
+        connection = self.backend.connect()
+        with self._condition:
+            self._stats['connections_created'] += 1
+        return connection
+    
+    def _is_healthy(self, connection, last_used: float) -> bool:
+        """Ping connections that have been idle longer than the health check interval"""
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        
+        with self._condition:
+            self._stats['health_checks'] += 1
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+    
+    def _discard(self, connection):
+        """Close a connection that is no longer usable and free its slot"""
+        with self._condition:
+            self._stats['discarded'] += 1
+            self._statements.pop(id(connection), None)
+            self._open -= 1
+            self._condition.notify()
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def get_connection(self) -> PooledConnection:
+        """Check out a connection, waiting up to checkout_timeout seconds for one to free up"""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        
+        while True:
+            # Take an idle connection or reserve a slot under the lock; connecting and
+            # pinging happen after releasing it so a slow server never blocks other
+            # checkouts or returns
+            connection = None
+            with self._condition:
+                while True:
+                    if self._idle:
+                        connection, last_used = self._idle.pop()
+                        break
+                    
+                    if self._open < self.pool_size:
+                        # Reserve the slot before connecting so other threads don't overshoot
+                        self._open += 1
+                        break
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise Exception(
+                            f"Timed out after {self.checkout_timeout}s waiting for a database connection "
+                            f"(pool size {self.pool_size})"
+                        )
+                    
+                    if not waited:
+                        self._stats['waits'] += 1
+                        waited = True
+                    wait_start = time.monotonic()
+                    self._condition.wait(remaining)
+                    self._stats['wait_time_total'] += time.monotonic() - wait_start
+            
+            if connection is None:
+                try:
+                    connection = self._connect()
+                except Exception:
+                    # Give the reserved slot back
+                    with self._condition:
+                        self._open -= 1
+                        self._condition.notify()
+                    raise
+                reused = False
+                break
+            
+            if self._is_healthy(connection, last_used):
+                reused = True
+                break
+            self._discard(connection)
+        
+        with self._condition:
+            if reused:
+                self._stats['reused'] += 1
+            self._stats['checkouts'] += 1
+            in_use = self._open - len(self._idle)
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], in_use)
+        
+        return PooledConnection(self, connection)
+    
+    def prepared_cursor(self, connection, query: str):
+        """
+        Return the prepared-statement cursor for `query` on a checked-out connection.
+        
+        The statement is prepared on the server the first time it runs and stays
+        prepared as long as the connection lives, so later calls only send the
+        parameters. Returns None when prepared statements are disabled.
+        """
+        if not self.max_prepared_statements:
+            return None
+        
+        # Only the thread that checked the connection out touches its statements
+        statements = self._statements.setdefault(id(connection), OrderedDict())
+        cursor = statements.get(query)
+        if cursor is not None:
+            statements.move_to_end(query)
+            with self._condition:
+                self._stats['statements_reused'] += 1
+            return cursor
+        
+        cursor = connection.cursor(prepared=True)
+        statements[query] = cursor
+        while len(statements) > self.max_prepared_statements:
+            _, evicted = statements.popitem(last=False)
+            try:
+                evicted.close()  # deallocates the statement on the server
+            except Exception:
+                pass
+        with self._condition:
+            self._stats['statements_prepared'] += 1
+        return cursor
+    
+    def _release(self, connection):
+        """Take a connection back from a caller"""
+        # End any open transaction so the next user doesn't inherit a stale snapshot
+        healthy = True
+        try:
+            connection.rollback()
+        except Exception:
+            healthy = False
+        
+        if not healthy:
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+    
+    def stats(self) -> Dict:
+        """Return a snapshot of pool usage counters"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['pool_size'] = self.pool_size
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._open - len(self._idle)
+        return stats
+    
+    def close_all(self):
+        """Close every idle connection (checked-out ones are closed when returned)"""
+        with self._condition:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._open -= 1
+                self._statements.pop(id(connection), None)
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a time-to-live, used for DatabaseManager reads"""
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 60.0):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.max_entries = max_entries
+        self.ttl = ttl
+        
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so reads that raced a write don't store stale results
+        self.generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+    
+    def get(self, key) -> Tuple[bool, object]:
+        """Return (found, value) for a key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+            
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return False, None
+            
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return True, value
+    
+    def set(self, key, value, generation: int):
+        """Store a value unless the cache was invalidated since `generation` was read"""
+        with self._lock:
+            if generation != self.generation:
+                return
+            
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+    
+    def invalidate(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self._stats['invalidations'] += 1
+    
+    def stats(self) -> Dict:
+        """Return a snapshot of cache counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['max_entries'] = self.max_entries
+            stats['ttl'] = self.ttl
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+class QueryStats:
+    """
+    Thread-safe per-method query statistics for DatabaseManager: call counts,
+    latency histograms, statements run, rows and (approximate) bytes moved,
+    plus a log of the slowest statements.
+    """
+    
+    def __init__(self, slow_query_ms: float = 200.0, slow_log_size: int = 50):
+        self.slow_query_ms = slow_query_ms
+        
+        self._methods = {}  # method name -> counters
+        self._slow = deque(maxlen=slow_log_size)  # newest last
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    @contextmanager
+    def method_context(self, method: str):
+        """Attribute statements run by this thread to `method` while the block runs"""
+        stack = self._local.__dict__.setdefault('methods', [])
+        stack.append(method)
+        try:
+            yield
+        finally:
+            stack.pop()
+    
+    def current_method(self) -> str:
+        """The innermost DatabaseManager method running on this thread"""
+        stack = self._local.__dict__.get('methods')
+        return stack[-1] if stack else '(other)'
+    
+    def _counters(self, method: str) -> Dict:
+        """Counters for a method, created on first use (call with the lock held)"""
+        counters = self._methods.get(method)
+        if counters is None:
+            counters = self._methods[method] = {
+                'calls': 0,
+                'errors': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'histogram': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                'statements': 0,
+                'rows': 0,
+                'bytes_sent': 0,
+                'bytes_received': 0
+            }
+        return counters
+    
+    def record_call(self, method: str, seconds: float, error: bool = False):
+        """Record one call of a DatabaseManager method"""
+        elapsed_ms = seconds * 1000
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+                      len(LATENCY_BUCKETS_MS))
+        with self._lock:
+            counters = self._counters(method)
+            counters['calls'] += 1
+            counters['errors'] += int(error)
+            counters['total_ms'] += elapsed_ms
+            counters['max_ms'] = max(counters['max_ms'], elapsed_ms)
+            counters['histogram'][bucket] += 1
+    
+    def record_statement(self, method: str, query: str, seconds: float, bytes_sent: int):
+        """Record one statement sent to the database, logging it if it was slow"""
+        elapsed_ms = seconds * 1000
+        with self._lock:
+            counters = self._counters(method)
+            counters['statements'] += 1
+            counters['bytes_sent'] += bytes_sent
+            if elapsed_ms >= self.slow_query_ms:
+                self._slow.append({
+                    'method': method,
+                    'ms': round(elapsed_ms, 2),
+                    'at': datetime.now().isoformat(sep=' ', timespec='seconds'),
+                    'query': ' '.join(query.split())
+                })
+    
+    def record_rows(self, method: str, rows: int, bytes_received: int):
+        """Record rows fetched by a method"""
+        with self._lock:
+            counters = self._counters(method)
+            counters['rows'] += rows
+            counters['bytes_received'] += bytes_received
+    
+    def stats(self) -> Dict[str, Dict]:
+        """Return a snapshot of the counters per method, busiest first"""
+        bucket_labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + ['+inf']
+        with self._lock:
+            methods = {name: dict(counters) for name, counters in self._methods.items()}
+        
+        for counters in methods.values():
+            counters['avg_ms'] = round(counters['total_ms'] / counters['calls'], 3) if counters['calls'] else 0.0
+            counters['total_ms'] = round(counters['total_ms'], 3)
+            counters['max_ms'] = round(counters['max_ms'], 3)
+            counters['histogram'] = dict(zip(bucket_labels, counters['histogram']))
+        return dict(sorted(methods.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+    
+    def slow_queries(self) -> List[Dict]:
+        """Return the slow query log, newest first"""
+        with self._lock:
+            return list(reversed(self._slow))
+    
+    def reset(self):
+        """Clear all counters and the slow query log"""
+        with self._lock:
+            self._methods.clear()
+            self._slow.clear()
+
+
+def _payload_size(values) -> int:
+    """Rough size of the values in a row or parameter list (text length, 8 bytes per other value)"""
+    if values is None:
+        return 0
+    if isinstance(values, dict):
+        values = values.values()
+    return sum(len(value) if isinstance(value, (str, bytes, bytearray)) else 8 for value in values)
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that reports statements, rows and bytes to QueryStats"""
+    
+    def __init__(self, cursor, stats: QueryStats, method: str):
+        self._cursor = cursor
+        self._stats = stats
+        self._method = method
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+    
+    def execute(self, query, params=None):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(query, params)
+        finally:
+            self._stats.record_statement(self._method, query, time.perf_counter() - start,
+                                         len(query) + _payload_size(params))
+    
+    def executemany(self, query, seq_params):
+        seq_params = list(seq_params)
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, seq_params)
+        finally:
+            self._stats.record_statement(self._method, query, time.perf_counter() - start,
+                                         len(query) + sum(_payload_size(params) for params in seq_params))
+    
+    def _count(self, rows: list) -> list:
+        self._stats.record_rows(self._method, len(rows), sum(_payload_size(row) for row in rows))
+        return rows
+    
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count([row])
+        return row
+    
+    def fetchmany(self, size=1):
+        return self._count(self._cursor.fetchmany(size))
+    
+    def fetchall(self):
+        return self._count(self._cursor.fetchall())
+    
+    def __iter__(self):
+        for row in self._cursor:
+            self._count([row])
+            yield row
+
+
+class InstrumentedConnection:
+    """Connection wrapper whose cursors report to QueryStats on behalf of one method"""
+    
+    def __init__(self, connection, stats: QueryStats, method: str):
+        self._connection = connection
+        self._stats = stats
+        self._method = method
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+    
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs), self._stats, self._method)
+    
+    def prepared_cursor(self, query: str):
+        prepared_cursor = getattr(self._connection, 'prepared_cursor', None)
+        cursor = prepared_cursor(query) if prepared_cursor else None
+        return InstrumentedCursor(cursor, self._stats, self._method) if cursor is not None else None
+    
+    def close(self):
+        self._connection.close()
+
+
+class UnitOfWorkConnection:
+    """
+    The connection shared by every call inside DatabaseManager.transaction().
+    
+    commit() and close() are left to the transaction, which commits once at the end.
+    """
+    
+    def __init__(self, connection):
+        self._connection = connection
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+    
+    def commit(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+def _copy_result(value):
+    """Copy cached rows so callers can't modify the cached objects"""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _cached(method):
+    """Serve a read method from the DatabaseManager cache when caching is enabled"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Inside a transaction reads may see uncommitted writes, which must not be cached
+        if self.cache is None or self.in_transaction():
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        found, value = self.cache.get(key)
+        if not found:
+            generation = self.cache.generation
+            value = method(self, *args, **kwargs)
+            self.cache.set(key, value, generation)
+        return _copy_result(value)
+    return wrapper
+
+
+def _timed(method):
+    """Record calls of a query method in DatabaseManager.stats (generators are timed until exhausted)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.stats is None:
+            return method(self, *args, **kwargs)
+        
+        name = method.__name__
+        start = time.perf_counter()
+        try:
+            with self.stats.method_context(name):
+                result = method(self, *args, **kwargs)
+        except Exception:
+            self.stats.record_call(name, time.perf_counter() - start, error=True)
+            raise
+        
+        if inspect.isgenerator(result):
+            return _timed_generator(self.stats, name, result, start)
+        self.stats.record_call(name, time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def _timed_generator(stats: QueryStats, name: str, generator: Iterator, start: float) -> Iterator:
+    """Pass a generator through, attributing the SQL it runs and its total time to `name`"""
+    error = False
+    try:
+        while True:
+            with stats.method_context(name):
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+    except Exception:
+        error = True
+        raise
+    finally:
+        generator.close()
+        stats.record_call(name, time.perf_counter() - start, error)
+
+
+def _writes(method):
+    """Mark a method that changes data so DatabaseManager can run its after-write hook"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        # Write methods return False, 0 or [] when nothing changed (e.g. an update that
+        # matched the stored hashes); a failed write raises and was rolled back
+        if result:
+            self._after_write()
+        return result
+    return wrapper
+
+
+def _reads(method):
+    """Mark a read-only method so DatabaseManager may run it on a read replica"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._read_context():
+            result = method(self, *args, **kwargs)
+        if inspect.isgenerator(result):
+            return _read_generator(self, result)
+        return result
+    return wrapper
+
+
+def _read_generator(db: 'DatabaseManager', generator: Iterator) -> Iterator:
+    """Pass a generator through, keeping the SQL it runs eligible for a read replica"""
+    try:
+        while True:
+            with db._read_context():
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        generator.close()
+
+
+# Post bodies live in blog_post_bodies so blog_posts rows stay narrow; join only when content is needed
+POST_BODY_JOIN = "JOIN blog_post_bodies ON blog_post_bodies.post_id = blog_posts.id"
+
+# Posts reference categories.id; the name is joined in and returned as `category`
+POST_CATEGORY_JOIN = "JOIN categories ON categories.id = blog_posts.category_id"
+
+# Post columns that are cheap to fetch (everything except the LONGTEXT content)
+POST_SUMMARY_COLUMNS = """
+    blog_posts.id, title, excerpt, categories.name AS category, category_id, image_path,
+    DATE_FORMAT(date, '%Y-%m-%d') as date, published, sort_order,
+    blog_posts.created_at, updated_at, content_hash, metadata_hash
+"""
+
+
+def hash_content(content: str) -> str:
+    """SHA-256 of a post body, as stored in blog_posts.content_hash"""
+    return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
+
+
+def hash_metadata(title: str, excerpt: str, category: str, image_path: str, date,
+                  published: bool, sort_order: int = 0) -> str:
+    """
+    SHA-256 of a post's metadata, as stored in blog_posts.metadata_hash.
+    
+    Matches SHA2(CONCAT_WS(CHAR(31), ...), 256) in migrations/005_content_hashes.sql.
+    """
+    parts = [title, excerpt, category, image_path, str(date)[:10], '1' if published else '0', str(int(sort_order or 0))]
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+# Upper bound on the post bodies sent in one bulk_upsert_posts chunk. executemany turns a
+# chunk into a single multi-row statement, which has to fit in MySQL's max_allowed_packet
+# (4 MB before MySQL 8.0); a body larger than this goes in a chunk of its own
+BULK_CHUNK_MAX_BYTES = 2 * 1024 * 1024
+
+# Post columns that patch_post / patch_posts may change
+PATCHABLE_POST_FIELDS = ('title', 'excerpt', 'content', 'category', 'image_path', 'date', 'published', 'sort_order')
 
 
 class DatabaseManager:
     """Handle all database operations"""
     
-    def __init__(self):
+    def __init__(self, pool_config: Dict = None, cache_config: Dict = None, backend: str = None,
+                 stats_config: Dict = None, replica_config: Dict = None):
         self.config = DB_CONFIG
         
+        sqlite_config = dict(DEFAULT_SQLITE_CONFIG)
+        sqlite_config.update(SQLITE_CONFIG)
+        backend_name = backend or DB_BACKEND
+        self.backend = create_backend(backend_name, self.config, sqlite_config)
+        
+        self.pool_config = dict(DEFAULT_POOL_CONFIG)
+        self.pool_config.update(POOL_CONFIG if pool_config is None else pool_config)
+        self.pool = self._create_pool(self.backend)
+        
+        self.replica_config = dict(DEFAULT_REPLICA_CONFIG)
+        self.replica_config.update(REPLICA_CONFIG if replica_config is None else replica_config)
+        
+        # Each endpoint overrides keys of the primary's settings (DB_CONFIG or SQLITE_CONFIG);
+        # replicas are only read from, so SQLite replica files are not initialized
+        self.replicas = []  # (backend, pool or None) per read endpoint
+        for endpoint in self.replica_config['endpoints']:
+            replica_backend = create_backend(
+                backend_name, dict(self.config, **endpoint), dict(sqlite_config, initialize=False, **endpoint)
+            )
+            self.replicas.append((replica_backend, self._create_pool(replica_backend)))
+        self._replica_cycle = itertools.cycle(range(len(self.replicas)))
+        self._routing_lock = threading.Lock()
+        self._last_write = None  # time.monotonic() of this manager's last write
+        self._routing_stats = {
+            'replica_reads': 0,
+            'primary_reads': 0,
+            'read_your_writes': 0,
+            'replica_failures': 0
+        }
+        
+        self.cache_config = dict(DEFAULT_CACHE_CONFIG)
+        self.cache_config.update(CACHE_CONFIG if cache_config is None else cache_config)
+        
+        self.cache = None
+        self._seen_content_version = None  # last value get_content_version() returned
+        if self.cache_config['enabled']:
+            self.cache = QueryCache(
+                max_entries=self.cache_config['max_entries'],
+                ttl=self.cache_config['ttl']
+            )
+        
+        self.stats_config = dict(DEFAULT_QUERY_STATS_CONFIG)
+        self.stats_config.update(QUERY_STATS_CONFIG if stats_config is None else stats_config)
+        
+        self.stats = None
+        if self.stats_config['enabled']:
+            self.stats = QueryStats(
+                slow_query_ms=self.stats_config['slow_query_ms'],
+                slow_log_size=self.stats_config['slow_log_size']
+            )
+        
+        # Per-thread unit of work opened by transaction() and read routing flag set by @_reads
+        self._local = threading.local()
+        
+    def _create_pool(self, backend: Backend) -> Optional[ConnectionPool]:
+        """Pool for one endpoint, or None when pooling is disabled"""
+        if not self.pool_config['enabled']:
+            return None
+        return ConnectionPool(
+            backend,
+            pool_size=self.pool_config['pool_size'],
+            checkout_timeout=self.pool_config['checkout_timeout'],
+            health_check_interval=self.pool_config['health_check_interval'],
+            max_prepared_statements=self.pool_config['max_prepared_statements']
+        )
+    
+    @contextmanager
+    def _read_context(self):
+        """Let connections opened by this thread inside the block go to a read replica"""
+        reading = getattr(self._local, 'reading', False)
+        self._local.reading = True
+        try:
+            yield
+        finally:
+            self._local.reading = reading
+    
+    def _read_replica(self) -> Optional[Tuple[Backend, Optional[ConnectionPool]]]:
+        """Pick the replica for a read, or None when the read must see the primary"""
+        if not self.replicas:
+            return None
+        
+        with self._routing_lock:
+            if (self._last_write is not None
+                    and time.monotonic() - self._last_write < self.replica_config['read_your_writes']):
+                # Replicas may not have caught up with our own write yet
+                self._routing_stats['read_your_writes'] += 1
+                return None
+            return self.replicas[next(self._replica_cycle)]
+    
+    def _open_connection(self, read: bool = False):
+        """Open or check out a connection (pooled when pooling is enabled)"""
+        replica = self._read_replica() if read else None
+        if replica:
+            replica_backend, replica_pool = replica
+            try:
+                connection = replica_pool.get_connection() if replica_pool else replica_backend.connect()
+                with self._routing_lock:
+                    self._routing_stats['replica_reads'] += 1
+                return connection
+            except Exception:
+                # Fall back to the primary rather than failing the read
+                with self._routing_lock:
+                    self._routing_stats['replica_failures'] += 1
+        
+        try:
+            if self.pool:
+                connection = self.pool.get_connection()
+            else:
+                connection = self.backend.connect()
+        except DB_ERRORS as e:
+            raise Exception(f"Error connecting to {self.backend.label}: {e}")
+        
+        if read and self.replicas:
+            with self._routing_lock:
+                self._routing_stats['primary_reads'] += 1
+        return connection
+    
     def get_connection(self):
-        """Create and return a database connection"""
+        """
+        Return a database connection: the transaction's connection inside transaction(),
+        a read replica inside read methods (when configured), the primary otherwise
+        """
+        connection = (getattr(self._local, 'connection', None)
+                      or self._open_connection(read=getattr(self._local, 'reading', False)))
+        
+        if self.stats:
+            return InstrumentedConnection(connection, self.stats, self.stats.current_method())
+        return connection
+    
+    def get_pool_stats(self) -> Optional[Dict]:
+        """Get connection pool statistics (None when pooling is disabled)"""
+        return self.pool.stats() if self.pool else None
+    
+    def get_routing_stats(self) -> Optional[Dict]:
+        """Get read replica routing counters and per-replica pool stats (None without replicas)"""
+        if not self.replicas:
+            return None
+        with self._routing_lock:
+            stats = dict(self._routing_stats)
+        stats['replicas'] = len(self.replicas)
+        stats['read_your_writes_window'] = self.replica_config['read_your_writes']
+        stats['replica_pools'] = [pool.stats() for _, pool in self.replicas if pool]
+        return stats
+    
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Get read cache statistics (None when caching is disabled)"""
+        return self.cache.stats() if self.cache else None
+    
+    def clear_cache(self):
+        """Drop all cached reads (e.g. after changing the database outside this app)"""
+        if self.cache:
+            self.cache.invalidate()
+    
+    def get_query_stats(self) -> Optional[Dict]:
+        """Get per-method query statistics and the slow query log (None when disabled)"""
+        if not self.stats:
+            return None
+        return {
+            'methods': self.stats.stats(),
+            'slow_queries': self.stats.slow_queries(),
+            'slow_query_ms': self.stats.slow_query_ms
+        }
+    
+    def reset_query_stats(self):
+        """Start the query statistics over"""
+        if self.stats:
+            self.stats.reset()
+    
+    def in_transaction(self) -> bool:
+        """True while the current thread is inside transaction()"""
+        return getattr(self._local, 'connection', None) is not None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run several operations as one unit of work: one connection, one commit.
+        
+            with db.transaction():
+                db.update_site_configs({'site_title': title, 'site_tagline': tagline})
+                db.rename_category(category_id, name)
+        
+        Every DatabaseManager call made by this thread inside the block shares the
+        connection and sees the block's own writes. Nothing is committed until the
+        block ends; if it raises, everything is rolled back. Nested blocks join the
+        outer one.
+        """
+        if self.in_transaction():
+            yield self
+            return
+        
+        connection = self._open_connection()
+        self._local.connection = UnitOfWorkConnection(connection)
+        self._local.wrote = False
         try:
-            connection = mysql.connector.connect(**self.config)
-            return connection
-        except Error as e:
-            raise Exception(f"Error connecting to MySQL: {e}")
+            try:
+                yield self
+            except BaseException:
+                try:
+                    connection.rollback()
+                except DB_ERRORS:
+                    pass  # the original error matters more
+                raise
+            
+            try:
+                if self._local.wrote:
+                    cursor = connection.cursor()
+                    self._bump_content_version(cursor)
+                    cursor.close()
+                connection.commit()
+            except DB_ERRORS as e:
+                try:
+                    connection.rollback()
+                except DB_ERRORS:
+                    pass
+                raise Exception(f"Error committing transaction: {e}")
+        finally:
+            self._local.connection = None
+            connection.close()
+        
+        if self._local.wrote:
+            self._after_write()
+    
+    def _after_write(self):
+        """Runs after every write method that changed data, so cached reads never outlive the data"""
+        if self.in_transaction():
+            # Nothing is visible to other connections until transaction() commits
+            self._local.wrote = True
+            return
+        if self.replicas:
+            with self._routing_lock:
+                self._last_write = time.monotonic()
+        if self.cache:
+            self.cache.invalidate()
+    
+    def _commit_write(self, conn, cursor, changed: bool = True):
+        """
+        Commit a write method's work. When it changed anything the content version moves
+        on in the same transaction, so no other app can miss the change; inside
+        transaction() it moves once, when the block commits.
+        """
+        if changed and not self.in_transaction():
+            self._bump_content_version(cursor)
+        conn.commit()
+    
+    @staticmethod
+    def _bump_content_version(cursor):
+        """Move the content version on within the write's transaction (see get_content_version)"""
+        cursor.execute("UPDATE content_version SET version = version + 1 WHERE id = 1")
     
     def test_connection(self) -> Tuple[bool, str]:
         """Test database connection"""
@@ -36,25 +1009,54 @@ class DatabaseManager:
         except Exception as e:
             return False, f"Connection failed: {str(e)}"
     
+    def _select(self, conn, query: str, params: Tuple = (), dictionary: bool = False) -> List:
+        """
+        Run a fixed SELECT (one whose text never changes between calls) and return all rows.
+        
+        On pooled connections the query runs as a server-side prepared statement that
+        stays cached on the connection, so repeat calls send only the parameters.
+        """
+        prepared_cursor = getattr(conn, 'prepared_cursor', None)
+        cursor = prepared_cursor(query) if prepared_cursor else None
+        owned = cursor is None
+        if owned:
+            cursor = conn.cursor()
+        
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        
+        if rows:
+            # The binary protocol can hand back text as bytes
+            rows = [tuple(value.decode('utf-8') if isinstance(value, (bytes, bytearray)) else value
+                          for value in row) for row in rows]
+            if dictionary:
+                columns = cursor.column_names
+                rows = [dict(zip(columns, row)) for row in rows]
+        if owned:
+            cursor.close()
+        return rows
+    
     # ==================== Blog Posts ====================
     
+    @_reads
+    @_timed
     def get_all_posts(self, published_only: bool = False) -> List[Dict]:
         """Retrieve all blog posts"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = """
-                SELECT id, title, excerpt, content, category, image_path, 
-                       DATE_FORMAT(date, '%Y-%m-%d') as date, published, sort_order,
-                       created_at, updated_at
+            query = f"""
+                SELECT {POST_SUMMARY_COLUMNS}, content
                 FROM blog_posts
+                {POST_CATEGORY_JOIN}
+                {POST_BODY_JOIN}
             """
             
             if published_only:
                 query += " WHERE published = TRUE"
             
-            query += " ORDER BY date DESC, sort_order DESC, id DESC"
+            query += " ORDER BY date DESC, sort_order DESC, blog_posts.id DESC"
             
             cursor.execute(query)
             posts = cursor.fetchall()
@@ -63,118 +1065,466 @@ class DatabaseManager:
             conn.close()
             
             return posts
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching posts: {e}")
     
+    @_cached
+    @_reads
+    @_timed
     def get_post_by_id(self, post_id: int) -> Optional[Dict]:
         """Retrieve a single post by ID"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
-            query = """
-                SELECT id, title, excerpt, content, category, image_path, 
-                       DATE_FORMAT(date, '%Y-%m-%d') as date, published, sort_order
+            query = f"""
+                SELECT blog_posts.id, title, excerpt, content, categories.name AS category, category_id,
+                       image_path, DATE_FORMAT(date, '%Y-%m-%d') as date, published, sort_order,
+                       content_hash, metadata_hash
                 FROM blog_posts
-                WHERE id = %s
+                {POST_CATEGORY_JOIN}
+                {POST_BODY_JOIN}
+                WHERE blog_posts.id = %s
             """
             
-            cursor.execute(query, (post_id,))
-            post = cursor.fetchone()
+            rows = self._select(conn, query, (post_id,), dictionary=True)
             
-            cursor.close()
             conn.close()
             
-            return post
-        except Error as e:
+            return rows[0] if rows else None
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching post: {e}")
     
+    @_writes
+    @_timed
     def add_post(self, title: str, excerpt: str, content: str, category: str, 
                  image_path: str, date: str, published: bool = True) -> int:
         """Add a new blog post"""
+        content_hash = hash_content(content)
+        metadata_hash = hash_metadata(title, excerpt, category, image_path, date, published)
+        
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             
+            category_id = self._category_id(cursor, category)
+            
             query = """
-                INSERT INTO blog_posts (title, excerpt, content, category, image_path, date, published)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                INSERT INTO blog_posts (title, excerpt, category_id, image_path, date, published,
+                                        content_hash, metadata_hash)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """
             
-            cursor.execute(query, (title, excerpt, content, category, image_path, date, published))
-            conn.commit()
-            
+            cursor.execute(query, (title, excerpt, category_id, image_path, date, published,
+                                   content_hash, metadata_hash))
             post_id = cursor.lastrowid
             
+            cursor.execute("INSERT INTO blog_post_bodies (post_id, content) VALUES (%s, %s)", (post_id, content))
+            
+            self._adjust_post_stats(cursor, category_id, published, 1)
+            self._commit_write(conn, cursor)
+            
             cursor.close()
             conn.close()
             
             return post_id
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error adding post: {e}")
     
+    @_writes
+    @_timed
     def update_post(self, post_id: int, title: str, excerpt: str, content: str, 
                    category: str, image_path: str, date: str, published: bool) -> bool:
-        """Update an existing blog post"""
+        """Update an existing blog post (returns False without writing when nothing changed)"""
+        content_hash = hash_content(content)
+        
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
-            query = """
-                UPDATE blog_posts 
-                SET title = %s, excerpt = %s, content = %s, category = %s, 
-                    image_path = %s, date = %s, published = %s
-                WHERE id = %s
-            """
-            
-            cursor.execute(query, (title, excerpt, content, category, image_path, date, published, post_id))
-            conn.commit()
+            # Lock the row and remember where it was counted before the change
+            rows = self._select(
+                conn,
+                "SELECT category_id, published, sort_order, content_hash, metadata_hash FROM blog_posts WHERE id = %s FOR UPDATE",
+                (post_id,)
+            )
+            previous = rows[0] if rows else None
+            cursor = conn.cursor()
             
-            rows_affected = cursor.rowcount
+            rows_affected = 0
+            if previous:
+                metadata_hash = hash_metadata(title, excerpt, category, image_path, date, published, previous[2])
+                content_changed = content_hash != previous[3]
+                
+                if content_changed or metadata_hash != previous[4]:
+                    category_id = self._category_id(cursor, category)
+                    
+                    # Leave the LONGTEXT body alone unless it actually changed
+                    columns = ['title', 'excerpt', 'category_id', 'image_path', 'date', 'published', 'metadata_hash']
+                    values = [title, excerpt, category_id, image_path, date, published, metadata_hash]
+                    if content_changed:
+                        columns.append('content_hash')
+                        values.append(content_hash)
+                    
+                    query = f"""
+                        UPDATE blog_posts 
+                        SET {', '.join(f'{column} = %s' for column in columns)}
+                        WHERE id = %s
+                    """
+                    
+                    cursor.execute(query, tuple(values) + (post_id,))
+                    rows_affected = cursor.rowcount
+                    
+                    if content_changed:
+                        cursor.execute(
+                            "UPDATE blog_post_bodies SET content = %s WHERE post_id = %s",
+                            (content, post_id)
+                        )
+                    
+                    self._adjust_post_stats(cursor, previous[0], previous[1], -1)
+                    self._adjust_post_stats(cursor, category_id, published, 1)
+            self._commit_write(conn, cursor, rows_affected > 0)
             
             cursor.close()
             conn.close()
             
             return rows_affected > 0
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error updating post: {e}")
     
+    @_writes
+    @_timed
+    def patch_post(self, post_id: int, **fields) -> bool:
+        """
+        Update only the given columns of a post, e.g. patch_post(7, title="New", published=False).
+        
+        Unlike update_post, the content is neither sent nor rewritten unless it is passed.
+        """
+        return self._patch_posts([post_id], fields) > 0
+    
+    @_writes
+    @_timed
+    def patch_posts(self, post_ids: Iterable[int], **fields) -> int:
+        """Apply the same column changes to many posts in one UPDATE; returns how many changed"""
+        return self._patch_posts(post_ids, fields)
+    
+    def publish_posts(self, post_ids: Iterable[int]) -> int:
+        """Publish a set of posts in one statement"""
+        return self.patch_posts(post_ids, published=True)
+    
+    def unpublish_posts(self, post_ids: Iterable[int]) -> int:
+        """Turn a set of posts back into drafts in one statement"""
+        return self.patch_posts(post_ids, published=False)
+    
+    def recategorize_posts(self, post_ids: Iterable[int], category: str) -> int:
+        """Move a set of posts to another category in one statement"""
+        return self.patch_posts(post_ids, category=category)
+    
+    def _patch_posts(self, post_ids: Iterable[int], fields: Dict) -> int:
+        """Run a partial UPDATE over a set of posts and keep the counters in step"""
+        unknown = set(fields) - set(PATCHABLE_POST_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot patch post field(s): {', '.join(sorted(unknown))}")
+        if not fields:
+            raise ValueError("No fields to update")
+        
+        post_ids = sorted(set(int(post_id) for post_id in post_ids))
+        if not post_ids:
+            return 0
+        
+        if 'published' in fields:
+            fields = dict(fields, published=bool(fields['published']))
+        new_content_hash = hash_content(fields['content']) if 'content' in fields else None
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            # Lock the rows and read what the new hashes and counters are computed from
+            cursor.execute(f"""
+                SELECT blog_posts.id, title, excerpt, categories.name AS category, category_id, image_path,
+                       DATE_FORMAT(date, '%Y-%m-%d') as date, published, sort_order, content_hash, metadata_hash
+                FROM blog_posts
+                {POST_CATEGORY_JOIN}
+                WHERE blog_posts.id IN ({', '.join(['%s'] * len(post_ids))})
+                FOR UPDATE
+            """, tuple(post_ids))
+            previous = cursor.fetchall()
+            
+            new_category_id = self._category_id(cursor, fields['category']) if 'category' in fields else None
+            
+            # Skip rows the patch wouldn't change at all
+            metadata_hashes = {}
+            content_changed_ids = []
+            stats_deltas = {}
+            for row in previous:
+                new_row = dict(row, **{k: v for k, v in fields.items() if k != 'content'})
+                metadata_hash = hash_metadata(
+                    new_row['title'], new_row['excerpt'], new_row['category'], new_row['image_path'],
+                    new_row['date'], new_row['published'], new_row['sort_order']
+                )
+                content_changed = new_content_hash is not None and new_content_hash != row['content_hash']
+                if metadata_hash == row['metadata_hash'] and not content_changed:
+                    continue
+                metadata_hashes[row['id']] = metadata_hash
+                if content_changed:
+                    content_changed_ids.append(row['id'])
+                
+                old_key = (row['category_id'], bool(row['published']))
+                new_key = (new_category_id or row['category_id'], bool(new_row['published']))
+                if old_key != new_key:
+                    stats_deltas[old_key] = stats_deltas.get(old_key, 0) - 1
+                    stats_deltas[new_key] = stats_deltas.get(new_key, 0) + 1
+            
+            rows_affected = 0
+            if metadata_hashes:
+                changed_ids = list(metadata_hashes)
+                columns = [column for column in PATCHABLE_POST_FIELDS if column in fields and column != 'content']
+                assignments = [f"{'category_id' if column == 'category' else column} = %s" for column in columns]
+                values = [new_category_id if column == 'category' else fields[column] for column in columns]
+                if new_content_hash is not None:
+                    assignments.append('content_hash = %s')
+                    values.append(new_content_hash)
+                
+                # Each row gets its own metadata hash, still in a single statement
+                assignments.append(
+                    "metadata_hash = CASE id " + " ".join(["WHEN %s THEN %s"] * len(changed_ids)) + " END"
+                )
+                for post_id in changed_ids:
+                    values.extend([post_id, metadata_hashes[post_id]])
+                
+                query = f"""
+                    UPDATE blog_posts
+                    SET {', '.join(assignments)}
+                    WHERE id IN ({', '.join(['%s'] * len(changed_ids))})
+                """
+                cursor.execute(query, tuple(values) + tuple(changed_ids))
+                rows_affected = cursor.rowcount
+            
+            if content_changed_ids:
+                cursor.execute(
+                    f"UPDATE blog_post_bodies SET content = %s WHERE post_id IN ({', '.join(['%s'] * len(content_changed_ids))})",
+                    (fields['content'], *content_changed_ids)
+                )
+            
+            for (category_id, published), delta in stats_deltas.items():
+                if delta:
+                    self._adjust_post_stats(cursor, category_id, published, delta)
+            
+            self._commit_write(conn, cursor, rows_affected > 0)
+            
+            cursor.close()
+            conn.close()
+            
+            return rows_affected
+        except DB_ERRORS as e:
+            raise Exception(f"Error updating posts: {e}")
+    
+    @_writes
+    @_timed
     def delete_post(self, post_id: int) -> bool:
         """Delete a blog post"""
         try:
             conn = self.get_connection()
+            
+            rows = self._select(conn, "SELECT category_id, published FROM blog_posts WHERE id = %s FOR UPDATE", (post_id,))
+            previous = rows[0] if rows else None
             cursor = conn.cursor()
             
             query = "DELETE FROM blog_posts WHERE id = %s"
             cursor.execute(query, (post_id,))
-            conn.commit()
-            
             rows_affected = cursor.rowcount
             
+            if previous and rows_affected > 0:
+                self._adjust_post_stats(cursor, previous[0], previous[1], -1)
+                # Leave a tombstone so change feed consumers learn about the delete
+                cursor.execute(
+                    self.backend.upsert_sql('deleted_posts', ['post_id'], ['post_id'],
+                                            assignments={'deleted_at': 'CURRENT_TIMESTAMP'}),
+                    (post_id,)
+                )
+            self._commit_write(conn, cursor, rows_affected > 0)
+            
             cursor.close()
             conn.close()
             
             return rows_affected > 0
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error deleting post: {e}")
     
+    @_writes
+    @_timed
+    def bulk_upsert_posts(self, posts: Iterable[Dict], chunk_size: int = 500, upsert: bool = False,
+                          max_chunk_bytes: int = BULK_CHUNK_MAX_BYTES) -> List[int]:
+        """
+        Insert many posts in one transaction, chunk by chunk with executemany.
+        
+        `posts` can be any iterable (e.g. a generator reading files); only one chunk
+        is held in memory at a time. A chunk ends after `chunk_size` posts or once its
+        bodies reach `max_chunk_bytes`, so large documents never build a statement
+        bigger than the server accepts. Each record needs title, excerpt, content,
+        category, image_path and date; published (default True) and sort_order
+        (default 0) are optional. With upsert=True, records that carry an `id`
+        update that post (or create it with that id); when an id appears more than
+        once, the last record wins. Returns the post ids in input order, each once.
+        Nothing is written if any chunk fails.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        columns = ['title', 'excerpt', 'category_id', 'image_path', 'date', 'published', 'sort_order',
+                   'content_hash', 'metadata_hash']
+        insert_query = f"""
+            INSERT INTO blog_posts ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+        """
+        upsert_query = self.backend.upsert_sql('blog_posts', ['id'] + columns, ['id'], columns)
+        body_query = self.backend.upsert_sql('blog_post_bodies', ['post_id', 'content'], ['post_id'], ['content'])
+        
+        post_ids = []
+        category_ids = {}  # category name -> id, looked up once per import
+        stats_deltas = {}  # (category_id, published) -> change in count
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            for chunk in self._bulk_chunks(posts, chunk_size, max_chunk_bytes):
+                if upsert:
+                    # The counters move once per row, so each id may only be written once
+                    chunk = self._last_record_per_id(chunk)
+                for record in chunk:
+                    name = record.get('category')
+                    if name is not None and name not in category_ids:
+                        category_ids[name] = self._category_id(cursor, name)
+                
+                rows = [self._bulk_post_row(record, columns, category_ids) for record in chunk]
+                contents = [record['content'] for record in chunk]
+                chunk_ids = [None] * len(chunk)
+                new_rows = []
+                upsert_rows = []
+                
+                for index, (record, row) in enumerate(zip(chunk, rows)):
+                    if upsert and record.get('id') is not None:
+                        chunk_ids[index] = int(record['id'])
+                        upsert_rows.append((int(record['id']),) + row)
+                    else:
+                        new_rows.append((index, row))
+                
+                if upsert_rows:
+                    # Existing rows move out of their old counters before being overwritten
+                    ids = [row[0] for row in upsert_rows]
+                    cursor.execute(
+                        f"SELECT category_id, published FROM blog_posts WHERE id IN ({', '.join(['%s'] * len(ids))}) FOR UPDATE",
+                        tuple(ids)
+                    )
+                    for category_id, published in cursor.fetchall():
+                        key = (category_id, bool(published))
+                        stats_deltas[key] = stats_deltas.get(key, 0) - 1
+                    
+                    cursor.executemany(upsert_query, upsert_rows)
+                
+                if new_rows:
+                    # executemany sends one multi-row INSERT; InnoDB hands a simple
+                    # multi-row insert a consecutive block of ids starting at lastrowid
+                    cursor.executemany(insert_query, [row for _, row in new_rows])
+                    first_id = cursor.lastrowid
+                    for offset, (index, _) in enumerate(new_rows):
+                        chunk_ids[index] = first_id + offset
+                
+                cursor.executemany(body_query, list(zip(chunk_ids, contents)))
+                
+                for row in rows:
+                    key = (row[2], bool(row[5]))
+                    stats_deltas[key] = stats_deltas.get(key, 0) + 1
+                
+                post_ids.extend(chunk_ids)
+            
+            for (category_id, published), delta in stats_deltas.items():
+                if delta:
+                    self._adjust_post_stats(cursor, category_id, published, delta)
+            
+            self._commit_write(conn, cursor, bool(post_ids))
+            
+            cursor.close()
+            conn.close()
+            
+            # An id repeated in a later chunk was already listed
+            return list(dict.fromkeys(post_ids))
+        except DB_ERRORS as e:
+            raise Exception(f"Error bulk importing posts: {e}")
+    
+    @staticmethod
+    def _bulk_chunks(posts: Iterable[Dict], chunk_size: int, max_bytes: int) -> Iterator[List[Dict]]:
+        """Split post records into chunks of at most chunk_size records and about max_bytes of content"""
+        chunk = []
+        size = 0
+        for record in posts:
+            length = len((record.get('content') or '').encode('utf-8'))
+            if chunk and (len(chunk) >= chunk_size or size + length > max_bytes):
+                yield chunk
+                chunk = []
+                size = 0
+            chunk.append(record)
+            size += length
+        if chunk:
+            yield chunk
+    
+    @staticmethod
+    def _last_record_per_id(records: List[Dict]) -> List[Dict]:
+        """Keep only the last record for each id, at the first one's position (records without an id are kept)"""
+        positions = {}
+        result = []
+        for record in records:
+            if record.get('id') is None:
+                result.append(record)
+                continue
+            post_id = int(record['id'])
+            if post_id in positions:
+                result[positions[post_id]] = record
+            else:
+                positions[post_id] = len(result)
+                result.append(record)
+        return result
+    
+    @staticmethod
+    def _bulk_post_row(record: Dict, columns: List[str], category_ids: Dict[str, int]) -> Tuple:
+        """Turn a post record into a blog_posts row tuple for bulk_upsert_posts"""
+        required = ['title', 'excerpt', 'content', 'category', 'image_path', 'date']
+        missing = [c for c in required if record.get(c) is None]
+        if missing:
+            raise ValueError(f"Post record is missing {', '.join(missing)}: {record.get('title', '')!r}")
+        
+        values = dict(record)
+        values['published'] = bool(values.get('published', True))
+        values['sort_order'] = int(values.get('sort_order') or 0)
+        values['category_id'] = category_ids[values['category']]
+        values['content_hash'] = hash_content(values['content'])
+        values['metadata_hash'] = hash_metadata(
+            values['title'], values['excerpt'], values['category'], values['image_path'],
+            values['date'], values['published'], values['sort_order']
+        )
+        return tuple(values[c] for c in columns)
+    
+    @_reads
+    @_timed
     def get_posts_by_category(self, category: str, published_only: bool = True) -> List[Dict]:
         """Get posts filtered by category"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = """
-                SELECT id, title, excerpt, content, category, image_path, 
+            query = f"""
+                SELECT blog_posts.id, title, excerpt, content, categories.name AS category, image_path, 
                        DATE_FORMAT(date, '%Y-%m-%d') as date, published
                 FROM blog_posts
-                WHERE category = %s
+                {POST_CATEGORY_JOIN}
+                {POST_BODY_JOIN}
+                WHERE categories.name = %s
             """
             
             if published_only:
                 query += " AND published = TRUE"
             
-            query += " ORDER BY date DESC, id DESC"
+            query += " ORDER BY date DESC, sort_order DESC, blog_posts.id DESC"
             
             cursor.execute(query, (category,))
             posts = cursor.fetchall()
@@ -183,45 +1533,434 @@ class DatabaseManager:
             conn.close()
             
             return posts
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching posts by category: {e}")
     
+    @_reads
+    @_timed
+    def get_post_summaries(self, published_only: bool = False, category: Optional[str] = None,
+                           limit: Optional[int] = None) -> List[Dict]:
+        """Retrieve post metadata for listings without the (large) content column"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            query = f"SELECT {POST_SUMMARY_COLUMNS} FROM blog_posts {POST_CATEGORY_JOIN}"
+            conditions, params = self._post_filters(published_only, category)
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            
+            query += " ORDER BY date DESC, sort_order DESC, blog_posts.id DESC"
+            
+            if limit is not None:
+                query += " LIMIT %s"
+                params.append(int(limit))
+            
+            cursor.execute(query, tuple(params))
+            posts = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+            
+            return posts
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching post summaries: {e}")
+    
+    @_reads
+    @_timed
+    def get_post_page(self, published_only: bool = False, category: Optional[str] = None,
+                      page_size: int = 20, after: Optional[str] = None,
+                      before: Optional[str] = None) -> Dict:
+        """
+        Retrieve one page of post summaries using keyset (seek) pagination.
+        
+        Pages follow the listing order (date, sort_order, id, newest first). Pass the
+        returned next_cursor as `after` for the next page, or prev_cursor as `before`
+        for the previous one. Every page costs the same, no matter how deep it is.
+        """
+        if after and before:
+            raise ValueError("Pass either after or before, not both")
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            conditions, params = self._post_filters(published_only, category)
+            
+            if after or before:
+                date, sort_order, post_id = self.parse_post_cursor(after or before)
+                op = '<' if after else '>'
+                conditions.append(
+                    f"(date {op} %s OR (date = %s AND (sort_order {op} %s"
+                    f" OR (sort_order = %s AND blog_posts.id {op} %s))))"
+                )
+                params.extend([date, date, sort_order, sort_order, post_id])
+            
+            query = f"SELECT {POST_SUMMARY_COLUMNS} FROM blog_posts {POST_CATEGORY_JOIN}"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            
+            # Walk backwards in ascending order when paging to the previous page
+            if before:
+                query += " ORDER BY date ASC, sort_order ASC, blog_posts.id ASC"
+            else:
+                query += " ORDER BY date DESC, sort_order DESC, blog_posts.id DESC"
+            
+            # Fetch one extra row to know whether another page exists
+            query += " LIMIT %s"
+            params.append(int(page_size) + 1)
+            
+            cursor.execute(query, tuple(params))
+            posts = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching post page: {e}")
+        
+        has_more = len(posts) > page_size
+        posts = posts[:page_size]
+        
+        if before:
+            posts.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, after is not None
+        
+        return {
+            'posts': posts,
+            'next_cursor': self.make_post_cursor(posts[-1]) if posts and has_next else None,
+            'prev_cursor': self.make_post_cursor(posts[0]) if posts and has_prev else None
+        }
+    
+    @_reads
+    @_timed
+    def search_posts(self, search: str, published_only: bool = False, category: Optional[str] = None,
+                     page: int = 1, page_size: int = 20) -> Dict:
+        """
+        Full-text search over title, excerpt and content (uses the ft_posts and
+        ft_post_bodies indexes).
+        
+        Returns one page of post summaries ranked by relevance, plus whether a
+        next page exists. Every search term must match somewhere in the post
+        (title, excerpt or body); terms also match as prefixes. Words the full-text
+        index leaves out (on MySQL: shorter than innodb_ft_min_token_size, or
+        stopwords, e.g. "AI") are matched as substrings with LIKE instead.
+        """
+        terms = self.backend.fulltext_terms(search)
+        if not terms:
+            return {'posts': [], 'page': page, 'has_next': False}
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            # Each term is looked up in both full-text indexes; a post matches when
+            # every term hit one of them, and its scores are added up
+            hits = []
+            hit_params = []
+            for number, (word, term) in enumerate(terms):
+                for index, table, key_column, columns in (
+                    ('ft_posts', 'blog_posts', 'id', ['title', 'excerpt']),
+                    ('ft_post_bodies', 'blog_post_bodies', 'post_id', ['content'])
+                ):
+                    if term is None:
+                        # '!' escapes LIKE wildcards in the word on both engines
+                        pattern = '%' + re.sub(r'([!%_])', r'!\1', word) + '%'
+                        matches = ' OR '.join(f"{column} LIKE %s ESCAPE '!'" for column in columns)
+                        sql = f"SELECT {key_column} AS post_id, 0 AS score FROM {table} WHERE {matches}"
+                        params = [pattern] * len(columns)
+                    else:
+                        sql, params = self.backend.fulltext_hits(index, table, key_column, columns, term)
+                    hits.append(f"SELECT {number} AS term, post_id, score FROM ({sql}) AS {index}_{number}")
+                    hit_params.extend(params)
+            conditions, params = self._post_filters(published_only, category)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            
+            query = f"""
+                SELECT {POST_SUMMARY_COLUMNS}, matches.relevance
+                FROM (
+                    SELECT post_id, SUM(score) AS relevance
+                    FROM ({' UNION ALL '.join(hits)}) AS hits
+                    GROUP BY post_id
+                    HAVING COUNT(DISTINCT term) = %s
+                ) AS matches
+                JOIN blog_posts ON blog_posts.id = matches.post_id
+                {POST_CATEGORY_JOIN}
+                {where}
+                ORDER BY relevance DESC, date DESC, blog_posts.id DESC
+                LIMIT %s OFFSET %s
+            """
+            
+            # Fetch one extra row to know whether another page exists
+            offset = (max(page, 1) - 1) * page_size
+            cursor.execute(query, (*hit_params, len(terms), *params, int(page_size) + 1, offset))
+            posts = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+        except DB_ERRORS as e:
+            raise Exception(f"Error searching posts: {e}")
+        
+        return {
+            'posts': posts[:page_size],
+            'page': page,
+            'has_next': len(posts) > page_size
+        }
+    
+    @staticmethod
+    def make_post_cursor(post: Dict) -> str:
+        """Build a pagination cursor from a post row"""
+        return f"{post['date']}|{post.get('sort_order') or 0}|{post['id']}"
+    
+    @staticmethod
+    def parse_post_cursor(cursor: str) -> Tuple[str, int, int]:
+        """Split a pagination cursor into (date, sort_order, id)"""
+        try:
+            date, sort_order, post_id = cursor.split('|')
+            return date, int(sort_order), int(post_id)
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid post cursor: {cursor!r}")
+    
+    def _post_filters(self, published_only: bool, category: Optional[str]) -> Tuple[List[str], List]:
+        """Build WHERE conditions shared by the post listing queries"""
+        conditions = []
+        params = []
+        
+        if published_only:
+            conditions.append("published = TRUE")
+        if category is not None:
+            conditions.append("categories.name = %s")
+            params.append(category)
+        
+        return conditions, params
+    
+    @_reads
+    @_timed
+    def iter_posts(self, published_only: bool = True, category: Optional[str] = None,
+                   include_content: bool = True, batch_size: int = 100) -> Iterator[Dict]:
+        """
+        Yield posts one at a time, in listing order, from an unbuffered cursor.
+        
+        Rows are pulled from the server in batches of `batch_size` as the caller
+        consumes them, so memory stays flat no matter how large the archive is.
+        The connection is held until the generator is exhausted or closed.
+        """
+        query = f"SELECT {POST_SUMMARY_COLUMNS}"
+        if include_content:
+            query += f", content FROM blog_posts {POST_CATEGORY_JOIN} {POST_BODY_JOIN}"
+        else:
+            query += f" FROM blog_posts {POST_CATEGORY_JOIN}"
+        conditions, params = self._post_filters(published_only, category)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY date DESC, sort_order DESC, blog_posts.id DESC"
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, tuple(params))
+        except DB_ERRORS as e:
+            raise Exception(f"Error streaming posts: {e}")
+        
+        exhausted = False
+        try:
+            while True:
+                try:
+                    rows = cursor.fetchmany(batch_size)
+                except DB_ERRORS as e:
+                    raise Exception(f"Error streaming posts: {e}")
+                if not rows:
+                    exhausted = True
+                    break
+                yield from rows
+        finally:
+            # A consumer that stops early leaves rows on the wire; drain them so the
+            # connection can be reused
+            if not exhausted:
+                try:
+                    conn.consume_results()
+                except Exception:
+                    pass
+            cursor.close()
+            conn.close()
+    
+    @_reads
+    @_timed
+    def get_post_content(self, post_id: int) -> Optional[str]:
+        """Load the content of a single post on demand"""
+        try:
+            conn = self.get_connection()
+            
+            query = "SELECT content FROM blog_post_bodies WHERE post_id = %s"
+            rows = self._select(conn, query, (post_id,))
+            
+            conn.close()
+            
+            return rows[0][0] if rows else None
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching post content: {e}")
+    
+    @_reads
+    @_timed
+    def get_post_contents(self, post_ids: Iterable[int]) -> Dict[int, str]:
+        """Load the content of several posts in one query; returns {post_id: content}"""
+        post_ids = list(post_ids)
+        if not post_ids:
+            return {}
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # The IN list varies in length, so this is not a fixed query for _select
+            cursor.execute(
+                f"SELECT post_id, content FROM blog_post_bodies WHERE post_id IN ({', '.join(['%s'] * len(post_ids))})",
+                tuple(post_ids)
+            )
+            contents = dict(cursor.fetchall())
+            
+            cursor.close()
+            conn.close()
+            
+            return contents
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching post contents: {e}")
+    
+    # ==================== Change Feed ====================
+    
+    @_reads
+    @_timed
+    def get_changes_since(self, since=None, include_content: bool = False) -> Dict:
+        """
+        Get every post created, updated or deleted at or after the `since` watermark.
+        
+        Returns {'changes': [...], 'watermark': ...}. Each change has 'op' ('created',
+        'updated' or 'deleted'), 'id', 'changed_at' and, except for deletes, the post
+        summary under 'post' (with content if include_content). Pass the returned
+        watermark as `since` next time. since=None returns every post as 'created'.
+        
+        Timestamps have one-second resolution, so changes made in the watermark's second
+        are returned again on the next call; consumers should apply changes idempotently.
+        """
+        source = f"{POST_SUMMARY_COLUMNS}, content FROM blog_posts {POST_CATEGORY_JOIN} {POST_BODY_JOIN}" \
+            if include_content else f"{POST_SUMMARY_COLUMNS} FROM blog_posts {POST_CATEGORY_JOIN}"
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            if since is None:
+                cursor.execute(f"SELECT {source} ORDER BY updated_at, blog_posts.id")
+                posts = cursor.fetchall()
+                tombstones = []
+            else:
+                cursor.execute(
+                    f"SELECT {source} WHERE updated_at >= %s ORDER BY updated_at, blog_posts.id",
+                    (since,)
+                )
+                posts = cursor.fetchall()
+                cursor.execute(
+                    "SELECT post_id, deleted_at FROM deleted_posts WHERE deleted_at >= %s ORDER BY deleted_at, post_id",
+                    (since,)
+                )
+                tombstones = cursor.fetchall()
+            
+            cursor.close()
+            conn.close()
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching changes: {e}")
+        
+        changes = []
+        for post in posts:
+            created = since is None or post['created_at'] >= self._as_datetime(since)
+            changes.append({
+                'op': 'created' if created else 'updated',
+                'id': post['id'],
+                'changed_at': post['updated_at'],
+                'post': post
+            })
+        for tombstone in tombstones:
+            changes.append({
+                'op': 'deleted',
+                'id': tombstone['post_id'],
+                'changed_at': tombstone['deleted_at'],
+                'post': None
+            })
+        
+        # Apply in the order things happened (a post may be deleted and re-created)
+        changes.sort(key=lambda change: (change['changed_at'], change['id']))
+        watermark = changes[-1]['changed_at'] if changes else since
+        
+        return {'changes': changes, 'watermark': watermark}
+    
+    @_writes
+    @_timed
+    def prune_tombstones(self, older_than_days: int = 30) -> int:
+        """Delete tombstones older than the given number of days; returns how many were removed"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                f"DELETE FROM deleted_posts WHERE deleted_at < {self.backend.days_ago_sql()}",
+                (int(older_than_days),)
+            )
+            removed = cursor.rowcount
+            self._commit_write(conn, cursor, removed > 0)
+            
+            cursor.close()
+            conn.close()
+            
+            return removed
+        except DB_ERRORS as e:
+            raise Exception(f"Error pruning tombstones: {e}")
+    
+    @staticmethod
+    def _as_datetime(value) -> datetime:
+        """Accept a datetime or an ISO 'YYYY-MM-DD[ HH:MM:SS]' string"""
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(str(value))
+    
     # ==================== Categories ====================
     
+    @_cached
+    @_reads
+    @_timed
     def get_all_categories(self) -> List[Dict]:
         """Get all categories"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             query = "SELECT * FROM categories ORDER BY display_order, name"
-            cursor.execute(query)
-            categories = cursor.fetchall()
+            categories = self._select(conn, query, dictionary=True)
             
-            cursor.close()
             conn.close()
             
             return categories
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching categories: {e}")
     
+    @_cached
+    @_reads
+    @_timed
     def get_unique_categories_from_posts(self) -> List[str]:
-        """Get unique categories from blog posts"""
+        """Get the names of categories that have published posts"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
-            query = "SELECT DISTINCT category FROM blog_posts WHERE published = TRUE ORDER BY category"
-            cursor.execute(query)
-            categories = [row[0] for row in cursor.fetchall()]
+            query = "SELECT name FROM categories WHERE published_count > 0 ORDER BY name"
+            categories = [row[0] for row in self._select(conn, query)]
             
-            cursor.close()
             conn.close()
             
             return categories
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching categories: {e}")
     
+    @_writes
+    @_timed
     def add_category(self, name: str, description: str = "", display_order: int = 0) -> int:
         """Add a new category"""
         try:
@@ -230,7 +1969,7 @@ class DatabaseManager:
             
             query = "INSERT INTO categories (name, description, display_order) VALUES (%s, %s, %s)"
             cursor.execute(query, (name, description, display_order))
-            conn.commit()
+            self._commit_write(conn, cursor)
             
             category_id = cursor.lastrowid
             
@@ -238,107 +1977,301 @@ class DatabaseManager:
             conn.close()
             
             return category_id
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error adding category: {e}")
     
+    @_writes
+    @_timed
+    def rename_category(self, category_id: int, name: str) -> bool:
+        """
+        Rename a category; its posts follow automatically since they reference the id.
+        
+        Only the categories row is written, so the change feed does not report the
+        affected posts and their metadata hashes keep the old name until next saved.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("UPDATE categories SET name = %s WHERE id = %s", (name, category_id))
+            rows_affected = cursor.rowcount
+            self._commit_write(conn, cursor, rows_affected > 0)
+            
+            cursor.close()
+            conn.close()
+            
+            return rows_affected > 0
+        except DB_ERRORS as e:
+            raise Exception(f"Error renaming category: {e}")
+    
+    def _category_id(self, cursor, name: str) -> int:
+        """Look up a category by name, creating it on first use (runs inside the caller's transaction)"""
+        cursor.execute("SELECT id FROM categories WHERE name = %s", (name,))
+        row = cursor.fetchone()
+        if row:
+            return row['id'] if isinstance(row, dict) else row[0]
+        
+        cursor.execute(self.backend.insert_ignore_sql('categories', ['name']), (name,))
+        if cursor.rowcount > 0:
+            return cursor.lastrowid
+        
+        # Another writer created it meanwhile; a locking read sees rows committed after our snapshot
+        cursor.execute("SELECT id FROM categories WHERE name = %s FOR UPDATE", (name,))
+        row = cursor.fetchone()
+        return row['id'] if isinstance(row, dict) else row[0]
+    
     # ==================== Site Config ====================
     
+    @_cached
+    @_reads
+    @_timed
     def get_site_config(self, key: str) -> Optional[str]:
         """Get a site configuration value"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
             query = "SELECT config_value FROM site_config WHERE config_key = %s"
-            cursor.execute(query, (key,))
-            result = cursor.fetchone()
+            rows = self._select(conn, query, (key,))
             
-            cursor.close()
             conn.close()
             
-            return result[0] if result else None
-        except Error as e:
+            return rows[0][0] if rows else None
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching config: {e}")
     
+    @_writes
+    @_timed
     def update_site_config(self, key: str, value: str) -> bool:
         """Update a site configuration value"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
             
-            query = """
-                INSERT INTO site_config (config_key, config_value) 
-                VALUES (%s, %s)
-                ON DUPLICATE KEY UPDATE config_value = %s
-            """
-            cursor.execute(query, (key, value, value))
-            conn.commit()
+            query = self.backend.upsert_sql('site_config', ['config_key', 'config_value'], ['config_key'], ['config_value'])
+            cursor.execute(query, (key, value))
+            self._commit_write(conn, cursor)
             
             cursor.close()
             conn.close()
             
             return True
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error updating config: {e}")
     
+    @_writes
+    @_timed
+    def update_site_configs(self, values: Dict[str, str]) -> bool:
+        """Update several site configuration values in one statement"""
+        if not values:
+            return True
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            query = self.backend.upsert_sql(
+                'site_config', ['config_key', 'config_value'], ['config_key'], ['config_value'], rows=len(values)
+            )
+            cursor.execute(query, [item for pair in values.items() for item in pair])
+            self._commit_write(conn, cursor)
+            
+            cursor.close()
+            conn.close()
+            
+            return True
+        except DB_ERRORS as e:
+            raise Exception(f"Error updating config: {e}")
+    
+    @_cached
+    @_reads
+    @_timed
     def get_all_site_config(self) -> Dict[str, str]:
         """Get all site configuration"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor(dictionary=True)
             
             query = "SELECT config_key, config_value FROM site_config"
-            cursor.execute(query)
-            results = cursor.fetchall()
+            results = self._select(conn, query)
             
-            cursor.close()
             conn.close()
             
-            return {row['config_key']: row['config_value'] for row in results}
-        except Error as e:
+            return {key: value for key, value in results}
+        except DB_ERRORS as e:
             raise Exception(f"Error fetching all config: {e}")
     
+    @_timed
+    def get_content_version(self) -> int:
+        """
+        Get the content version, which grows after every write through any DatabaseManager.
+        
+        Results computed from posts or settings can be cached under this number and
+        reused for as long as it stays the same. Never cached here, so changes made by
+        the other app show up on the next call; when the number has moved, this
+        manager's own query cache is cleared too, so reads after it see those changes.
+        
+        Always read from the primary: the invalidation signal must not come from a
+        replica that is ahead of the one serving the reads that follow.
+        """
+        try:
+            conn = self.get_connection()
+            
+            rows = self._select(conn, "SELECT version FROM content_version WHERE id = 1")
+            
+            conn.close()
+        except DB_ERRORS as e:
+            raise Exception(f"Error fetching content version: {e}")
+        
+        version = rows[0][0] if rows else 0
+        if version != self._seen_content_version:
+            if self.cache:
+                self.cache.invalidate()
+            self._seen_content_version = version
+        return version
+    
     # ==================== Statistics ====================
+    # Post counts come from the published_count/draft_count counters on categories,
+    # which every post write keeps current, so they cost O(categories).
     
+    @_cached
+    @_reads
+    @_timed
     def get_post_count(self, published_only: bool = True) -> int:
         """Get total number of posts"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
-            query = "SELECT COUNT(*) FROM blog_posts"
             if published_only:
-                query += " WHERE published = TRUE"
+                query = "SELECT COALESCE(SUM(published_count), 0) FROM categories"
+            else:
+                query = "SELECT COALESCE(SUM(published_count + draft_count), 0) FROM categories"
             
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
+            count = int(self._select(conn, query)[0][0])
             
-            cursor.close()
             conn.close()
             
             return count
-        except Error as e:
+        except DB_ERRORS as e:
             raise Exception(f"Error getting post count: {e}")
     
+    @_cached
+    @_reads
+    @_timed
     def get_category_post_counts(self) -> Dict[str, int]:
         """Get post counts by category"""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
             query = """
-                SELECT category, COUNT(*) as count 
-                FROM blog_posts 
-                WHERE published = TRUE 
-                GROUP BY category 
-                ORDER BY category
+                SELECT name, published_count
+                FROM categories
+                WHERE published_count > 0
+                ORDER BY name
             """
-            cursor.execute(query)
-            results = cursor.fetchall()
+            results = self._select(conn, query)
             
-            cursor.close()
             conn.close()
             
-            return {row[0]: row[1] for row in results}
-        except Error as e:
+            return {row[0]: int(row[1]) for row in results}
+        except DB_ERRORS as e:
             raise Exception(f"Error getting category counts: {e}")
+    
+    @_cached
+    @_reads
+    @_timed
+    def get_dashboard_stats(self, recent_limit: int = 5) -> Dict:
+        """
+        Get everything the dashboards show in a single query: total/published/draft
+        counts, per-category counts, the top category and the most recent posts.
+        """
+        try:
+            conn = self.get_connection()
+            
+            query = f"""
+                SELECT 'category' AS row_type, name AS label, NULL AS id,
+                       published_count, draft_count, NULL AS published, NULL AS date,
+                       NULL AS category
+                FROM categories
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 'recent', title, blog_posts.id, NULL, NULL, published,
+                           DATE_FORMAT(date, '%Y-%m-%d'), categories.name
+                    FROM blog_posts
+                    {POST_CATEGORY_JOIN}
+                    ORDER BY date DESC, sort_order DESC, blog_posts.id DESC
+                    LIMIT %s
+                ) AS recent
+            """
+            rows = self._select(conn, query, (int(recent_limit),), dictionary=True)
+            
+            conn.close()
+        except DB_ERRORS as e:
+            raise Exception(f"Error getting dashboard stats: {e}")
+        
+        category_counts = {}
+        published_posts = 0
+        draft_posts = 0
+        recent_posts = []
+        
+        for row in rows:
+            if row['row_type'] == 'category':
+                published_posts += int(row['published_count'])
+                draft_posts += int(row['draft_count'])
+                if row['published_count'] > 0:
+                    category_counts[row['label']] = int(row['published_count'])
+            else:
+                recent_posts.append({
+                    'id': row['id'],
+                    'title': row['label'],
+                    'date': row['date'],
+                    'category': row['category'],
+                    'published': bool(row['published'])
+                })
+        
+        category_counts = dict(sorted(category_counts.items()))
+        top_category = max(category_counts.items(), key=lambda x: x[1])[0] if category_counts else None
+        
+        return {
+            'total_posts': published_posts + draft_posts,
+            'published_posts': published_posts,
+            'draft_posts': draft_posts,
+            'category_counts': category_counts,
+            'top_category': top_category,
+            'recent_posts': recent_posts
+        }
+    
+    @_writes
+    @_timed
+    def rebuild_post_stats(self) -> bool:
+        """Recount the category counters from blog_posts (e.g. after editing posts by hand in MySQL)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # Each count is an index range on idx_category_listing (category_id, published, ...)
+            cursor.execute("""
+                UPDATE categories
+                SET published_count = (SELECT COUNT(*) FROM blog_posts
+                                       WHERE category_id = categories.id AND published = TRUE),
+                    draft_count = (SELECT COUNT(*) FROM blog_posts
+                                   WHERE category_id = categories.id AND published = FALSE)
+            """)
+            self._commit_write(conn, cursor)
+            
+            cursor.close()
+            conn.close()
+            
+            return True
+        except DB_ERRORS as e:
+            raise Exception(f"Error rebuilding post stats: {e}")
+    
+    def _adjust_post_stats(self, cursor, category_id: int, published: bool, delta: int):
+        """Add delta to the counter of one category (runs inside the caller's transaction)"""
+        published_delta = delta if published else 0
+        draft_delta = 0 if published else delta
+        
+        cursor.execute("""
+            UPDATE categories
+            SET published_count = published_count + %s,
+                draft_count = draft_count + %s
+            WHERE id = %s
+        """, (published_delta, draft_delta, category_id))
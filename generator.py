@@ -3,60 +3,551 @@ Static Site Generator
 Generates static HTML files from database content
 """
 
+import hashlib
+import json
+import math
 import os
-from typing import List, Dict
+import re
+import unicodedata
+from collections import Counter
+import html as html_module
+from typing import Callable, List, Dict, Iterable, Optional
 from datetime import datetime
 from config import SITE_CONFIG, OUTPUT_CONFIG
 
 
+# Folder (inside the output folder) holding one page per post
+POSTS_FOLDER = "posts"
+
+# Folder holding listing pages 2, 3, ... (page 1 is the index itself)
+PAGES_FOLDER = "page"
+
+# Folder holding one paginated listing per category: category/<slug>/index.html
+CATEGORIES_FOLDER = "category"
+
+# Folder holding one JSON shard per post body for client-side search: content/<id>-<hash>.json
+CONTENT_FOLDER = "content"
+
+# Card metadata of every post, loaded by the search box on first use
+POSTS_INDEX_FILENAME = "posts-index.json"
+
+# Record of the last build inside the output folder: every output file with a hash of its inputs
+MANIFEST_FILENAME = ".build-manifest.json"
+
+# Bump when a change to the page templates should re-render every page on the next build
+TEMPLATE_VERSION = 2
+
+# Posts whose pages are rendered together, with their content loaded in one content_loader call
+CONTENT_BATCH_SIZE = 50
+
+# Post fields a card or post page shows, besides the content
+CARD_FIELDS = ('id', 'title', 'excerpt', 'category', 'image_path', 'date')
+
+# Cards per listing page when OUTPUT_CONFIG has no 'posts_per_page'
+DEFAULT_POSTS_PER_PAGE = 12
+
+# Client-side search for the listing pages. Nothing is downloaded until the visitor
+# types: then posts-index.json (metadata only) is fetched once, and a result's
+# article is fetched from its content shard when opened.
+SEARCH_SCRIPT = """
+    <script>
+        let postsIndex = null;
+        let listingHtml = null;
+
+        function loadPostsIndex() {
+            if (!postsIndex) {
+                postsIndex = fetch('posts-index.json').then(response => response.json());
+            }
+            return postsIndex;
+        }
+
+        function renderCards(posts) {
+            if (posts.length === 0) {
+                return `
+                    <div class="col-12 text-center text-muted py-5">
+                        <h3>No matching posts</h3>
+                    </div>
+                `;
+            }
+            return posts.map(post => `
+                <div class="col-md-6 col-lg-4" data-category="${post.category}">
+                    <div class="card blog-card">
+                        <img src="${post.image}" class="card-img-top" alt="${post.title}" onerror="this.src='https://via.placeholder.com/400x200?text=Image+Not+Found'">
+                        <div class="card-body d-flex flex-column">
+                            <div class="mb-2">
+                                <span class="badge badge-date">${post.category}</span>
+                                <span class="badge bg-secondary ms-2">${post.date}</span>
+                            </div>
+                            <h5 class="card-title">${post.title}</h5>
+                            <p class="card-text flex-grow-1">${post.excerpt}</p>
+                            <a class="btn btn-primary btn-read-more mt-auto" href="${post.url}" onclick="return showArticle(${post.id})">
+                                Read More →
+                            </a>
+                        </div>
+                    </div>
+                </div>
+            `).join('');
+        }
+
+        async function searchPosts(query) {
+            const grid = document.getElementById('blogGrid');
+            showResults();
+            if (listingHtml === null) {
+                listingHtml = grid.innerHTML;
+            }
+            query = query.trim().toLowerCase();
+            if (!query) {
+                grid.innerHTML = listingHtml;
+                return;
+            }
+            const posts = await loadPostsIndex();
+            grid.innerHTML = renderCards(posts.filter(post =>
+                [post.title, post.excerpt, post.category].join(' ').toLowerCase().includes(query)
+            ));
+        }
+
+        function showArticle(id) {
+            loadPostsIndex().then(posts => {
+                const post = posts.find(post => post.id === id);
+                return fetch(post.content)
+                    .then(response => response.json())
+                    .then(shard => {
+                        document.getElementById('articleContent').innerHTML = shard.content;
+                        document.getElementById('blogGrid').classList.add('d-none');
+                        document.getElementById('fullArticle').classList.remove('d-none');
+                        window.scrollTo(0, 0);
+                    })
+                    // Fall back to the post's own page
+                    .catch(() => { window.location.href = post.url; });
+            });
+            return false;
+        }
+
+        function showResults() {
+            document.getElementById('fullArticle').classList.add('d-none');
+            document.getElementById('blogGrid').classList.remove('d-none');
+            return false;
+        }
+    </script>
+"""
+
+
+def slugify(text: str, max_length: int = 60, fallback: str = 'post') -> str:
+    """Lowercase ASCII words joined by hyphens, for file names and URLs (`fallback` when none are left)"""
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii')
+    slug = re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return slug[:max_length].rstrip('-') or fallback
+
+
+def post_url(post: Dict) -> str:
+    """Path of a post's page relative to the site root, e.g. posts/12-my-title.html"""
+    return f"{POSTS_FOLDER}/{post['id']}-{slugify(post['title'])}.html"
+
+
+def page_url(page_number: int, index_filename: str = "index.html", folder: str = "") -> str:
+    """
+    Path of a listing page relative to the site root: the index, then page/2.html, ...
+    
+    `folder` places the listing below the root, e.g. 'category/teaching-tools/'.
+    """
+    return folder + (index_filename if page_number == 1 else f"{PAGES_FOLDER}/{page_number}.html")
+
+
+def category_slugs(categories: Iterable[str]) -> Dict[str, str]:
+    """
+    Folder name under category/ for each category, unique among `categories`.
+    
+    A name that leaves no slug (e.g. one in a non-Latin script) or shares its slug
+    with another name (e.g. 'C++' and 'C#') gets a short hash of the name appended.
+    """
+    slugs = {category: slugify(category, fallback='') for category in categories}
+    counts = Counter(slugs.values())
+    for category, slug in slugs.items():
+        if not slug or counts[slug] > 1:
+            digest = hashlib.sha256(category.encode('utf-8')).hexdigest()[:8]
+            slugs[category] = f"{slug}-{digest}" if slug else digest
+    return slugs
+
+
+def category_url(category: str, slugs: Optional[Dict[str, str]] = None) -> str:
+    """
+    Path of a category's first listing page relative to the site root.
+    
+    `slugs` is category_slugs() of all the site's categories; without it the
+    category's folder is named as if it were the only one.
+    """
+    slug = (slugs or category_slugs([category]))[category]
+    return f"{CATEGORIES_FOLDER}/{slug}/index.html"
+
+
+def content_shard_url(post_id: int, content_hash: str) -> str:
+    """
+    Path of a post's content shard relative to the site root, e.g. content/12-3f2a....json
+    
+    Named after the content (and template version) alone, so the name is known
+    without loading the content.
+    """
+    digest = hashlib.sha256(f"{TEMPLATE_VERSION}:{content_hash}".encode('utf-8')).hexdigest()
+    return f"{CONTENT_FOLDER}/{post_id}-{digest[:16]}.json"
+
+
+def input_key(*inputs) -> str:
+    """
+    Hash of everything an output file is rendered from, as recorded in the build manifest.
+    
+    Inputs are plain values (strings, numbers, dates, lists); repr() is much faster
+    than JSON here and just as stable.
+    """
+    return hashlib.sha256(repr(inputs).encode('utf-8')).hexdigest()
+
+
+class BuildManifest:
+    """
+    The outputs of the last build, each mapped to a hash of the inputs it was rendered from.
+    
+    Stored in the output folder as .build-manifest.json. A build calls is_current()
+    for every file it would write and skips rendering when the inputs are unchanged;
+    finish() deletes the files the previous build wrote and this one did not.
+    """
+    
+    def __init__(self, output_folder: str, force: bool = False):
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, MANIFEST_FILENAME)
+        self.previous = {}
+        self.outputs = {}
+        self.stats = {'written': 0, 'unchanged': 0, 'deleted': 0}
+        # File names per output subfolder, listed once instead of a stat per file
+        self._existing = {}
+        
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.previous = manifest['outputs']
+        except (OSError, ValueError, KeyError):
+            manifest = {}
+        # The previous outputs are still deleted when left out, but nothing counts as current
+        self.force = force or manifest.get('template_version') != TEMPLATE_VERSION
+    
+    def is_current(self, url: str, key: str) -> bool:
+        """
+        Record that this build produces `url` (relative to the output folder) from inputs hashing to `key`.
+        
+        True when the last build wrote it from the same inputs and the file is still there.
+        """
+        self.outputs[url] = key
+        if not self.force and self.previous.get(url) == key and self._exists(url):
+            self.stats['unchanged'] += 1
+            return True
+        self.stats['written'] += 1
+        return False
+    
+    def finish(self) -> Dict:
+        """Delete the outputs this build no longer produces, save the manifest and return the stats"""
+        for url in self.previous.keys() - self.outputs.keys():
+            output_path = self._output_path(url)
+            try:
+                os.remove(output_path)
+            except FileNotFoundError:
+                continue
+            self.stats['deleted'] += 1
+            # Drop folders left empty, e.g. the listing of a category that has no posts any more
+            try:
+                os.removedirs(os.path.dirname(output_path))
+            except OSError:
+                pass
+        
+        SiteGenerator._write_file(self.path, json.dumps(
+            {'template_version': TEMPLATE_VERSION, 'outputs': self.outputs}, separators=(',', ':')
+        ))
+        return self.stats
+    
+    def _output_path(self, url: str) -> str:
+        return os.path.join(self.output_folder, *url.split('/'))
+    
+    def _exists(self, url: str) -> bool:
+        folder, _, filename = url.rpartition('/')
+        if folder not in self._existing:
+            try:
+                self._existing[folder] = set(os.listdir(self._output_path(folder)))
+            except FileNotFoundError:
+                self._existing[folder] = set()
+        return filename in self._existing[folder]
+
+
 class SiteGenerator:
     """Generate static HTML site from database content"""
     
-    def __init__(self, site_config: Dict = None):
+    def __init__(self, site_config: Dict = None, posts_per_page: int = None, client_search: bool = None):
         self.site_config = site_config or SITE_CONFIG
         self.output_folder = OUTPUT_CONFIG['output_folder']
+        self.posts_per_page = posts_per_page or OUTPUT_CONFIG.get('posts_per_page', DEFAULT_POSTS_PER_PAGE)
+        self.client_search = OUTPUT_CONFIG.get('client_search', True) if client_search is None else client_search
+        # Every page shows the site config, so a change to it re-renders them all
+        self.site_hash = input_key(sorted(self.site_config.items()))
         
         # Ensure output folder exists
         os.makedirs(self.output_folder, exist_ok=True)
     
-    def generate_index(self, posts: List[Dict], output_filename: str = "index.html") -> str:
-        """Generate the main index.html file with all blog posts"""
+    def generate_site(self, posts: Iterable[Dict], index_filename: str = "index.html",
+                      categories: Optional[List[str]] = None,
+                      content_loader: Optional[Callable[[List[int]], Dict[int, str]]] = None,
+                      force: bool = False) -> Dict:
+        """
+        Generate one page per published post plus the paginated listings linking to them:
+        the index and one listing per category.
         
-        # Get unique categories
-        categories = sorted(set(post['category'] for post in posts if post.get('published', True)))
+        Builds are incremental: the build manifest (see BuildManifest) records what every
+        output was rendered from, and only outputs whose inputs changed since the last
+        build are rendered again. Outputs of deleted posts, emptied categories and surplus
+        listing pages are removed. `force` renders everything.
         
-        html = self._generate_html_template(posts, categories)
+        `posts` may be a list or a one-pass iterator such as DatabaseManager.iter_posts().
+        Posts without `content` (e.g. from get_post_summaries(), which include the stored
+        content_hash) are fine when `content_loader` is given, e.g.
+        DatabaseManager.get_post_contents: it is called with a list of up to
+        CONTENT_BATCH_SIZE post ids, only for the posts whose page has to be rendered
+        again, and returns {post_id: content}.
         
-        # Write to file
-        output_path = os.path.join(self.output_folder, output_filename)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        With client_search, posts-index.json and a content shard per post are written too
+        (see generate_posts_index()).
+        
+        Returns {'index': first index page, 'pages': [index pages],
+        'categories': {category: [listing pages]}, 'posts': [post page paths],
+        'build': {'written': n, 'unchanged': n, 'deleted': n}}.
+        """
+        manifest = BuildManifest(self.output_folder, force)
+        os.makedirs(os.path.join(self.output_folder, POSTS_FOLDER), exist_ok=True)
+        if self.client_search:
+            os.makedirs(os.path.join(self.output_folder, CONTENT_FOLDER), exist_ok=True)
+        
+        cards = []
+        post_paths = []
+        shard_urls = {}
+        pending = []  # (post, write page, write shard) waiting for their content
+        for post in posts:
+            if not post.get('published', True):
+                continue
+            if 'content' not in post and not post.get('content_hash'):
+                post = self._with_contents([post], content_loader)[0]
+            content_hash = self._content_hash(post)
+            
+            url = post_url(post)
+            write_page = not manifest.is_current(
+                url, input_key(self.site_hash, index_filename, self._card_inputs(post), content_hash)
+            )
+            post_paths.append(os.path.join(self.output_folder, *url.split('/')))
+            
+            write_shard = False
+            if self.client_search:
+                shard_url = content_shard_url(post['id'], content_hash)
+                write_shard = not manifest.is_current(shard_url, content_hash)
+                shard_urls[post['id']] = shard_url
+            
+            if write_page or write_shard:
+                pending.append((post, write_page, write_shard))
+                if len(pending) >= CONTENT_BATCH_SIZE:
+                    self._generate_post_files(pending, index_filename, content_loader)
+                    pending = []
+            
+            cards.append({key: value for key, value in post.items() if key != 'content'})
+        self._generate_post_files(pending, index_filename, content_loader)
+        
+        if self.client_search:
+            self.generate_posts_index(cards, shard_urls, manifest)
+        
+        if categories is None:
+            categories = sorted(set(card['category'] for card in cards))
+        page_paths = self.generate_index(cards, index_filename, categories, manifest)
+        category_paths = self.generate_category_pages(cards, categories, index_filename, manifest)
+        
+        return {'index': page_paths[0], 'pages': page_paths, 'categories': category_paths,
+                'posts': post_paths, 'build': manifest.finish()}
+    
+    def generate_content_shard(self, post: Dict) -> str:
+        """
+        Write a post's body to content/<id>-<hash>.json and return that path (relative to the root).
         
+        The name includes a hash of the content, so a shard never changes once
+        written and can be cached forever; an edited post gets a new file name.
+        """
+        url = content_shard_url(post['id'], self._content_hash(post))
+        output_path = os.path.join(self.output_folder, *url.split('/'))
+        if not os.path.exists(output_path):
+            self._write_file(output_path, json.dumps(
+                {'id': post['id'], 'content': self._article_html(post)}, ensure_ascii=False
+            ))
+        return url
+    
+    def generate_posts_index(self, posts: Iterable[Dict], shard_urls: Dict[int, str],
+                             manifest: Optional[BuildManifest] = None) -> str:
+        """
+        Write posts-index.json: card metadata for every published post, each with the
+        path of its content shard. This is all the search box downloads up front.
+        """
+        posts = [post for post in posts if post.get('published', True)]
+        output_path = os.path.join(self.output_folder, POSTS_INDEX_FILENAME)
+        if manifest is not None and manifest.is_current(POSTS_INDEX_FILENAME, input_key(
+            [self._card_inputs(post) for post in posts], [shard_urls[post['id']] for post in posts]
+        )):
+            return output_path
+        
+        entries = []
+        for post in posts:
+            entry = self._post_json_entry(post)
+            entry['content'] = shard_urls[post['id']]
+            entries.append(entry)
+        
+        self._write_file(output_path, json.dumps(entries, ensure_ascii=False, separators=(',', ':')))
         return output_path
     
-    def _generate_html_template(self, posts: List[Dict], categories: List[str]) -> str:
-        """Generate the complete HTML template"""
+    def generate_index(self, posts: Iterable[Dict], output_filename: str = "index.html",
+                       categories: Optional[List[str]] = None,
+                       manifest: Optional[BuildManifest] = None) -> List[str]:
+        """
+        Generate the index listing the blog posts, `posts_per_page` cards per page.
+        
+        Page 1 is `output_filename`, later pages are page/2.html, page/3.html, ... with
+        newer/older links between them. Only card metadata is used (posts without
+        `content` are fine); every card links to the post's own page. With a `manifest`,
+        pages whose cards did not change are left as they are.
+        
+        Returns the paths of the pages written, first page first.
+        """
+        posts = [post for post in posts if post.get('published', True)]
+        if categories is None:
+            categories = sorted(set(post['category'] for post in posts))
+        
+        return self._write_listing(posts, categories, index_filename=output_filename, manifest=manifest)
+    
+    def generate_category_pages(self, posts: Iterable[Dict], categories: Optional[List[str]] = None,
+                                index_filename: str = "index.html",
+                                manifest: Optional[BuildManifest] = None) -> Dict[str, List[str]]:
+        """
+        Generate a paginated listing per category at category/<slug>/index.html.
+        
+        Each listing holds only its own category's cards, so browsing a category never
+        downloads the rest of the archive.
+        
+        Returns {category: [paths of its pages, first page first]}.
+        """
+        posts = [post for post in posts if post.get('published', True)]
+        if categories is None:
+            categories = sorted(set(post['category'] for post in posts))
+        
+        posts_by_category = {category: [] for category in categories}
+        for post in posts:
+            posts_by_category.setdefault(post['category'], []).append(post)
+        
+        slugs = category_slugs(categories)
+        category_paths = {}
+        for category in categories:
+            folder = f"{CATEGORIES_FOLDER}/{slugs[category]}/"
+            category_paths[category] = self._write_listing(
+                posts_by_category[category], categories, index_filename, folder=folder, category=category,
+                manifest=manifest
+            )
+        
+        return category_paths
+    
+    def _write_listing(self, posts: List[Dict], categories: List[str], index_filename: str = "index.html",
+                       folder: str = "", category: Optional[str] = None,
+                       manifest: Optional[BuildManifest] = None) -> List[str]:
+        """Write one paginated listing (the index, or a category's when `category` is set)"""
+        first_filename = index_filename if category is None else "index.html"
+        category_filters_html = self._generate_category_filters(categories, category, index_filename)
         
-        # Generate blog cards HTML
-        blog_cards_html = self._generate_blog_cards(posts)
+        page_count = max(1, math.ceil(len(posts) / self.posts_per_page))
+        os.makedirs(os.path.join(self.output_folder, *(folder + PAGES_FOLDER).split('/')), exist_ok=True)
         
-        # Generate category filters
-        category_filters_html = self._generate_category_filters(categories)
+        page_paths = []
+        for page_number in range(1, page_count + 1):
+            start = (page_number - 1) * self.posts_per_page
+            page_posts = posts[start:start + self.posts_per_page]
+            url = page_url(page_number, first_filename, folder)
+            output_path = os.path.join(self.output_folder, *url.split('/'))
+            page_paths.append(output_path)
+            
+            if manifest is not None and manifest.is_current(url, input_key(
+                self.site_hash, index_filename, categories, category, page_number, page_count,
+                self.client_search, [self._card_inputs(post) for post in page_posts]
+            )):
+                continue
+            html = self._render_page(
+                category_filters_html,
+                self._generate_blog_cards(page_posts),
+                self._generate_pagination(page_number, page_count, first_filename, folder),
+                base='../' * url.count('/'),
+                index_filename=index_filename,
+                heading=category
+            )
+            self._write_file(output_path, html)
         
-        # Generate JSON data - we'll embed it in a data attribute
-        import json
-        import html as html_module
-        posts_json = self._generate_posts_json(posts)
-        # HTML-escape the JSON so it's safe in a data attribute
-        posts_json_safe = html_module.escape(posts_json)
+        return page_paths
+    
+    def generate_post_page(self, post: Dict, index_filename: str = "index.html") -> str:
+        """Generate the page for one post at posts/<id>-<slug>.html"""
+        output_path = os.path.join(self.output_folder, *post_url(post).split('/'))
+        self._write_file(output_path, self._render_post_page(post, index_filename))
+        return output_path
+    
+    @staticmethod
+    def _card_inputs(post: Dict) -> List:
+        """The post fields shown on its card and page (besides the content)"""
+        return [post.get(field) for field in CARD_FIELDS]
+    
+    @staticmethod
+    def _content_hash(post: Dict) -> str:
+        """SHA-256 of the post body: the stored content_hash, or computed from `content`"""
+        if post.get('content_hash'):
+            return post['content_hash']
+        return hashlib.sha256((post['content'] or '').encode('utf-8')).hexdigest()
+    
+    def _generate_post_files(self, pending: List, index_filename: str,
+                             content_loader: Optional[Callable[[List[int]], Dict[int, str]]]):
+        """Write the post pages and content shards of a batch of (post, write page, write shard)"""
+        posts = self._with_contents([post for post, _, _ in pending], content_loader)
+        for post, (_, write_page, write_shard) in zip(posts, pending):
+            if write_page:
+                self.generate_post_page(post, index_filename)
+            if write_shard:
+                self.generate_content_shard(post)
+    
+    @staticmethod
+    def _with_contents(posts: List[Dict],
+                       content_loader: Optional[Callable[[List[int]], Dict[int, str]]]) -> List[Dict]:
+        """The posts with their content, loaded in one `content_loader` call for those that have none"""
+        missing = [post['id'] for post in posts if 'content' not in post]
+        if not missing:
+            return posts
+        if content_loader is None:
+            raise ValueError(f"Post {missing[0]} has no content and no content_loader was given")
+        contents = content_loader(missing)
+        return [post if 'content' in post else dict(post, content=contents.get(post['id']) or '')
+                for post in posts]
+    
+    @staticmethod
+    def _write_file(output_path: str, text: str):
+        """Write to a temporary file and swap it in, so a failed build never leaves half a page"""
+        temp_path = output_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, output_path)
+    
+    def _render_page(self, category_filters_html: str, blog_cards_html: str, pagination_html: str,
+                     base: str = '', index_filename: str = "index.html", heading: Optional[str] = None) -> str:
+        """
+        Fill the listing page template (`heading` names the category on category pages).
         
-        # Generate the full HTML
+        `base` leads from the page back to the site root (e.g. '../' for page/2.html);
+        all links in the page are written relative to the root.
+        """
         html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.site_config['site_title']}</title>
+    {f'<base href="{base}">' if base else ''}
+    <title>{f"{heading} - " if heading else ""}{self.site_config['site_title']}</title>
     <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
     <style>
         :root {{
@@ -111,22 +602,6 @@ class SiteGenerator:
             background-color: #2980b9;
         }}
 
-        #fullArticle {{
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-
-        .back-btn {{
-            color: var(--accent-color);
-            text-decoration: none;
-            font-weight: 500;
-        }}
-
-        .back-btn:hover {{
-            color: var(--primary-color);
-        }}
-
         .filter-section {{
             background-color: white;
             padding: 20px;
@@ -144,16 +619,32 @@ class SiteGenerator:
             color: white;
         }}
 
+        .pagination .page-link {{
+            color: var(--accent-color);
+        }}
+
+        #fullArticle {{
+            background-color: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+
+        .back-btn {{
+            color: var(--accent-color);
+            text-decoration: none;
+            font-weight: 500;
+        }}
+
         .article-content img {{
             max-width: 100%;
             height: auto;
         }}
     </style>
 </head>
-<body data-blog-posts="{posts_json_safe}">
+<body>
     <nav class="navbar navbar-expand-lg navbar-dark">
         <div class="container">
-            <a class="navbar-brand fw-bold" href="#" onclick="showHome()">
+            <a class="navbar-brand fw-bold" href="{index_filename}">
                 {self.site_config['site_title']}
             </a>
             <button class="navbar-toggler" type="button" data-bs-toggle="collapse" data-bs-target="#navbarNav">
@@ -162,7 +653,7 @@ class SiteGenerator:
             <div class="collapse navbar-collapse" id="navbarNav">
                 <ul class="navbar-nav ms-auto">
                     <li class="nav-item">
-                        <a class="nav-link" href="#" onclick="showHome()">Home</a>
+                        <a class="nav-link" href="{index_filename}">Home</a>
                     </li>
                     <li class="nav-item">
                         <a class="nav-link" href="about.html">About</a>
@@ -175,17 +666,18 @@ class SiteGenerator:
     <div class="hero text-center" id="heroSection">
         <div class="container">
             <h1 class="display-4 fw-bold mb-3">{self.site_config['site_title']}</h1>
-            <p class="lead">{self.site_config['site_tagline']}</p>
+            <p class="lead">{heading or self.site_config['site_tagline']}</p>
         </div>
     </div>
 
     <div class="container mb-5">
         <!-- Filter Section -->
         <div id="filterSection" class="filter-section">
-            <h5 class="mb-3">Filter by Category:</h5>
+            <h5 class="mb-3">Browse by Category:</h5>
             <div id="categoryFilters">
                 {category_filters_html}
             </div>
+            {self._generate_search_box()}
         </div>
 
         <div id="blogGrid" class="row g-4">
@@ -193,11 +685,11 @@ class SiteGenerator:
         </div>
 
         <div id="fullArticle" class="p-4 d-none">
-            <a href="#" class="back-btn" onclick="showHome()">← Back to all posts</a>
-            <article id="articleContent" class="mt-4 article-content">
-                <!-- Full article content will be inserted here by JavaScript -->
-            </article>
+            <a href="#" class="back-btn" onclick="return showResults()">← Back to results</a>
+            <article id="articleContent" class="mt-4 article-content"></article>
         </div>
+
+        {pagination_html}
     </div>
 
     <footer class="bg-dark text-white text-center py-4 mt-5">
@@ -208,114 +700,50 @@ class SiteGenerator:
     </footer>
 
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // Read blog posts data from data attribute
-        const postsData = document.body.getAttribute('data-blog-posts');
-        const allBlogPosts = JSON.parse(postsData);
-        let currentFilter = 'all';
-
-        function filterByCategory(category) {{
-            currentFilter = category;
-            
-            // Update active button
-            document.querySelectorAll('.filter-btn').forEach(btn => {{
-                btn.classList.remove('active');
-            }});
-            event.target.classList.add('active');
-            
-            renderBlogCards();
-        }}
-
-        function getFilteredPosts() {{
-            if (currentFilter === 'all') {{
-                return allBlogPosts;
-            }}
-            return allBlogPosts.filter(post => post.category === currentFilter);
-        }}
-
-        function renderBlogCards() {{
-            const grid = document.getElementById('blogGrid');
-            const posts = getFilteredPosts();
-
-            if (posts.length === 0) {{
-                grid.innerHTML = `
-                    <div class="col-12 text-center text-muted py-5">
-                        <h3>No posts in this category</h3>
-                        <p>Check back soon for new content!</p>
-                    </div>
-                `;
-                return;
-            }}
-
-            grid.innerHTML = posts.map(post => `
-                <div class="col-md-6 col-lg-4" data-category="${{post.category}}">
-                    <div class="card blog-card">
-                        <img src="${{post.image}}" class="card-img-top" alt="${{post.title}}" onerror="this.src='https://via.placeholder.com/400x200?text=Image+Not+Found'">
-                        <div class="card-body d-flex flex-column">
-                            <div class="mb-2">
-                                <span class="badge badge-date">${{post.category}}</span>
-                                <span class="badge bg-secondary ms-2">${{new Date(post.date).toLocaleDateString()}}</span>
-                            </div>
-                            <h5 class="card-title">${{post.title}}</h5>
-                            <p class="card-text flex-grow-1">${{post.excerpt}}</p>
-                            <button class="btn btn-primary btn-read-more mt-auto" onclick="showArticle(${{post.id}})">
-                                Read More →
-                            </button>
-                        </div>
-                    </div>
-                </div>
-            `).join('');
-        }}
-
-        function showArticle(id) {{
-            const post = allBlogPosts.find(p => p.id === id);
-            if (!post) return;
-
-            document.getElementById('blogGrid').classList.add('d-none');
-            document.getElementById('heroSection').classList.add('d-none');
-            document.getElementById('filterSection').style.display = 'none';
-            document.getElementById('fullArticle').classList.remove('d-none');
-            document.getElementById('articleContent').innerHTML = post.content;
-            window.scrollTo(0, 0);
-        }}
-
-        function showHome() {{
-            document.getElementById('blogGrid').classList.remove('d-none');
-            document.getElementById('heroSection').classList.remove('d-none');
-            document.getElementById('filterSection').style.display = 'block';
-            document.getElementById('fullArticle').classList.add('d-none');
-            window.scrollTo(0, 0);
-            return false;
-        }}
-
-        // Initialize - render all posts
-        renderBlogCards();
-    </script>
+    {SEARCH_SCRIPT if self.client_search else ''}
 </body>
 </html>"""
         
         return html
     
+    def _generate_search_box(self) -> str:
+        """Generate the search field shown above the cards when client_search is on"""
+        if not self.client_search:
+            return ''
+        return """
+            <input type="search" class="form-control mt-3" placeholder="Search all posts..."
+                   oninput="searchPosts(this.value)" aria-label="Search all posts">
+            """
+    
     def _generate_blog_cards(self, posts: List[Dict]) -> str:
         """Generate HTML for all blog post cards"""
         if not posts:
-            return """
+            return self._generate_empty_cards()
+        
+        cards_html = []
+        for post in posts:
+            if not post.get('published', True):
+                continue
+            cards_html.append(self._generate_blog_card(post))
+        
+        return '\n'.join(cards_html)
+    
+    def _generate_empty_cards(self) -> str:
+        """Generate the placeholder shown when there are no posts"""
+        return """
             <div class="col-12 text-center text-muted py-5">
                 <h3>No blog posts yet</h3>
                 <p>Check back soon for new content!</p>
             </div>
             """
+    
+    def _generate_blog_card(self, post: Dict) -> str:
+        """Generate HTML for one blog post card"""
+        date_str = post.get('date', '')
+        if isinstance(date_str, datetime):
+            date_str = date_str.strftime('%Y-%m-%d')
         
-        cards_html = []
-        for post in posts:
-            if not post.get('published', True):
-                continue
-            
-            date_str = post.get('date', '')
-            if isinstance(date_str, datetime):
-                date_str = date_str.strftime('%Y-%m-%d')
-            
-            card = f"""
+        return f"""
             <div class="col-md-6 col-lg-4" data-category="{post['category']}">
                 <div class="card blog-card">
                     <img src="{post['image_path']}" class="card-img-top" alt="{post['title']}" onerror="this.src='https://via.placeholder.com/400x200?text=Image+Not+Found'">
@@ -326,63 +754,176 @@ class SiteGenerator:
                         </div>
                         <h5 class="card-title">{post['title']}</h5>
                         <p class="card-text flex-grow-1">{post['excerpt']}</p>
-                        <button class="btn btn-primary btn-read-more mt-auto" onclick="showArticle({post['id']})">
+                        <a class="btn btn-primary btn-read-more mt-auto" href="{post_url(post)}">
                             Read More →
-                        </button>
+                        </a>
                     </div>
                 </div>
             </div>
             """
-            cards_html.append(card)
-        
-        return '\n'.join(cards_html)
     
-    def _generate_category_filters(self, categories: List[str]) -> str:
-        """Generate HTML for category filter buttons"""
-        buttons = ['<button class="btn btn-outline-primary filter-btn active" onclick="filterByCategory(\'all\')">All Posts</button>']
+    def _generate_category_filters(self, categories: List[str], active: Optional[str] = None,
+                                   index_filename: str = "index.html") -> str:
+        """Generate links to the index and each category listing (`active` is the current category)"""
+        links = [
+            f'<a class="btn btn-outline-primary filter-btn{"" if active else " active"}" href="{index_filename}">All Posts</a>'
+        ]
         
+        slugs = category_slugs(categories)
         for category in categories:
-            buttons.append(
-                f'<button class="btn btn-outline-primary filter-btn" onclick="filterByCategory(\'{category}\')">{category}</button>'
+            links.append(
+                f'<a class="btn btn-outline-primary filter-btn{" active" if category == active else ""}" '
+                f'href="{category_url(category, slugs)}">{category}</a>'
             )
         
-        return '\n'.join(buttons)
+        return '\n'.join(links)
     
-    def _generate_posts_json(self, posts: List[Dict]) -> str:
-        """Generate JavaScript array of blog posts"""
-        import json
-        import html
+    def _generate_pagination(self, page_number: int, page_count: int, index_filename: str = "index.html",
+                             folder: str = "") -> str:
+        """Generate newer/older links for one listing page (nothing when there is only one page)"""
+        if page_count <= 1:
+            return ''
         
-        # Filter only published posts and prepare for JSON
-        published_posts = []
-        for post in posts:
-            if not post.get('published', True):
-                continue
-            
-            # Convert datetime to string
-            date_str = post.get('date', '')
-            if isinstance(date_str, datetime):
-                date_str = date_str.strftime('%Y-%m-%d')
-            
-            # Clean up content - remove excessive newlines
-            content = post['content']
-            # Remove multiple consecutive newlines
-            import re
-            content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-            content = content.strip()
-            
-            published_posts.append({
-                'id': post['id'],
-                'title': post['title'],
-                'excerpt': post['excerpt'],
-                'content': content,
-                'category': post['category'],
-                'image': post['image_path'],
-                'date': date_str
-            })
-        
-        # Use json.dumps which properly escapes everything for JavaScript
-        return json.dumps(published_posts, ensure_ascii=False)
+        newer = (f'<li class="page-item"><a class="page-link" href="{page_url(page_number - 1, index_filename, folder)}">← Newer</a></li>'
+                 if page_number > 1 else
+                 '<li class="page-item disabled"><span class="page-link">← Newer</span></li>')
+        older = (f'<li class="page-item"><a class="page-link" href="{page_url(page_number + 1, index_filename, folder)}">Older →</a></li>'
+                 if page_number < page_count else
+                 '<li class="page-item disabled"><span class="page-link">Older →</span></li>')
+        
+        return f"""
+        <nav class="mt-5" aria-label="Pages">
+            <ul class="pagination justify-content-center">
+                {newer}
+                <li class="page-item disabled"><span class="page-link">Page {page_number} of {page_count}</span></li>
+                {older}
+            </ul>
+        </nav>
+        """
+    
+    def _post_json_entry(self, post: Dict) -> Dict:
+        """Prepare one post's card metadata for posts-index.json"""
+        # Convert datetime to string
+        date_str = post.get('date', '')
+        if isinstance(date_str, datetime):
+            date_str = date_str.strftime('%Y-%m-%d')
+        
+        return {
+            'id': post['id'],
+            'title': post['title'],
+            'excerpt': post['excerpt'],
+            'category': post['category'],
+            'image': post['image_path'],
+            'date': date_str,
+            'url': post_url(post)
+        }
+    
+    @staticmethod
+    def _clean_content(content: str) -> str:
+        """Remove excessive newlines from a post body"""
+        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content or '')
+        return content.strip()
+    
+    def _article_html(self, post: Dict) -> str:
+        """
+        The cleaned post body, with in-page links (footnotes, endnotes and bookmarks
+        from Word, e.g. href="#footnote-1") pointed at the post's own page. Post pages
+        resolve links against the site root, and shards are shown on listing pages,
+        so a bare "#..." would leave the article.
+        """
+        url = post_url(post)
+        return re.sub(r'href=(["\'])#', lambda match: f'href={match.group(1)}{url}#',
+                      self._clean_content(post['content']))
+    
+    def _render_post_page(self, post: Dict, index_filename: str = "index.html") -> str:
+        """Fill the post page template (the content carries its own heading, date and image)"""
+        html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- Links, images and the post content use paths relative to the site root -->
+    <base href="../">
+    <title>{post['title']} - {self.site_config['site_title']}</title>
+    <meta name="description" content="{html_module.escape(post['excerpt'] or '')}">
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+    <style>
+        :root {{
+            --primary-color: {self.site_config.get('primary_color', '#2c3e50')};
+            --accent-color: {self.site_config.get('accent_color', '#3498db')};
+        }}
+
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background-color: #f8f9fa;
+        }}
+
+        .navbar {{
+            background: linear-gradient(135deg, var(--primary-color), var(--accent-color));
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+
+        #fullArticle {{
+            background-color: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            margin: 40px 0;
+        }}
+
+        .back-btn {{
+            color: var(--accent-color);
+            text-decoration: none;
+            font-weight: 500;
+        }}
+
+        .back-btn:hover {{
+            color: var(--primary-color);
+        }}
+
+        .article-content img {{
+            max-width: 100%;
+            height: auto;
+        }}
+    </style>
+</head>
+<body>
+    <nav class="navbar navbar-expand-lg navbar-dark">
+        <div class="container">
+            <a class="navbar-brand fw-bold" href="{index_filename}">
+                {self.site_config['site_title']}
+            </a>
+            <div class="collapse navbar-collapse">
+                <ul class="navbar-nav ms-auto">
+                    <li class="nav-item">
+                        <a class="nav-link" href="{index_filename}">Home</a>
+                    </li>
+                    <li class="nav-item">
+                        <a class="nav-link" href="about.html">About</a>
+                    </li>
+                </ul>
+            </div>
+        </div>
+    </nav>
+
+    <div class="container">
+        <div id="fullArticle" class="p-4">
+            <a href="{index_filename}" class="back-btn">← Back to all posts</a>
+            <article id="articleContent" class="mt-4 article-content">
+                {self._article_html(post)}
+            </article>
+        </div>
+    </div>
+
+    <footer class="bg-dark text-white text-center py-4 mt-5">
+        <div class="container">
+            <p class="mb-0">{self.site_config['footer_text']}</p>
+            {f'<p class="mb-0 mt-2"><small>{self.site_config["acknowledgment"]}</small></p>' if self.site_config.get('acknowledgment') else ''}
+        </div>
+    </footer>
+</body>
+</html>"""
+        
+        return html
     
     def generate_about_page(self, content: str, output_filename: str = "about.html") -> str:
         """Generate an about page"""
@@ -0,0 +1,12 @@
+-- ============================================
+-- Migration 001: Full-text search on blog posts
+-- Adds the FULLTEXT index used by DatabaseManager.search_posts()
+-- Run with: mysql -u root -p FCS3 < migrations/001_fulltext_search.sql
+-- ============================================
+
+USE FCS3;
+
+ALTER TABLE blog_posts
+    ADD FULLTEXT INDEX ft_posts (title, excerpt, content);
+
+SELECT 'Migration 001 applied: ft_posts index created' AS status;
@@ -0,0 +1,30 @@
+-- ============================================
+-- Migration 002: Composite indexes for post listings
+-- Replaces the single-column indexes on blog_posts with composite indexes
+-- that match the real query shapes:
+--   - WHERE published = TRUE ORDER BY date DESC, sort_order DESC, id DESC
+--   - WHERE category = ? [AND published = TRUE] ORDER BY date DESC, sort_order DESC, id DESC
+--   - WHERE published = TRUE GROUP BY category / DISTINCT category
+-- Run with: mysql -u root -p FCS3 < migrations/002_composite_indexes.sql
+-- Then check the plans with: python check_query_plans.py
+-- ============================================
+
+USE FCS3;
+
+ALTER TABLE blog_posts
+    ADD INDEX idx_listing (date, sort_order, id),
+    ADD INDEX idx_published_listing (published, date, sort_order, id),
+    ADD INDEX idx_category_listing (category, published, date, sort_order, id),
+    ADD INDEX idx_category_date (category, date, sort_order, id),
+    ADD INDEX idx_published_category (published, category);
+
+-- The old single-column indexes are prefixes of the new ones (or unused)
+ALTER TABLE blog_posts
+    DROP INDEX idx_category,
+    DROP INDEX idx_date,
+    DROP INDEX idx_published,
+    DROP INDEX idx_sort_order;
+
+ANALYZE TABLE blog_posts;
+
+SELECT 'Migration 002 applied: composite listing indexes created' AS status;
@@ -0,0 +1,23 @@
+-- ============================================
+-- Migration 003: Post counters table
+-- Adds category_stats, which DatabaseManager keeps current on every
+-- add/update/delete so dashboard statistics no longer scan blog_posts.
+-- Run with: mysql -u root -p FCS3 < migrations/003_category_stats.sql
+-- ============================================
+
+USE FCS3;
+
+CREATE TABLE IF NOT EXISTS category_stats (
+    category VARCHAR(100) NOT NULL PRIMARY KEY,
+    published_count INT NOT NULL DEFAULT 0,
+    draft_count INT NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Backfill the counters from existing posts
+DELETE FROM category_stats;
+INSERT INTO category_stats (category, published_count, draft_count)
+SELECT category, SUM(published = TRUE), SUM(published = FALSE)
+FROM blog_posts
+GROUP BY category;
+
+SELECT 'Migration 003 applied: category_stats created and filled' AS status;
@@ -0,0 +1,20 @@
+-- ============================================
+-- Migration 004: Change feed
+-- Indexes blog_posts.updated_at and adds the deleted_posts tombstone table
+-- used by DatabaseManager.get_changes_since().
+-- Run with: mysql -u root -p FCS3 < migrations/004_change_feed.sql
+-- ============================================
+
+USE FCS3;
+
+ALTER TABLE blog_posts
+    ADD INDEX idx_updated_at (updated_at);
+
+CREATE TABLE IF NOT EXISTS deleted_posts (
+    post_id INT NOT NULL PRIMARY KEY,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    
+    INDEX idx_deleted_at (deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+SELECT 'Migration 004 applied: change feed index and tombstone table created' AS status;
@@ -0,0 +1,26 @@
+-- ============================================
+-- Migration 005: Content and metadata hashes
+-- Adds the hash columns DatabaseManager uses to skip no-op writes and that
+-- caches/build tooling can compare instead of whole post bodies.
+-- The expressions below match hash_content() / hash_metadata() in database.py.
+-- Run with: mysql -u root -p FCS3 < migrations/005_content_hashes.sql
+-- ============================================
+
+USE FCS3;
+
+ALTER TABLE blog_posts
+    ADD COLUMN content_hash CHAR(64) NULL AFTER sort_order,
+    ADD COLUMN metadata_hash CHAR(64) NULL AFTER content_hash,
+    ADD INDEX idx_content_hash (content_hash);
+
+-- Backfill existing posts (keep updated_at as it was; this is not a content change)
+UPDATE blog_posts
+SET content_hash = SHA2(content, 256),
+    metadata_hash = SHA2(CONCAT_WS(CHAR(31 USING utf8mb4),
+                                   title, excerpt, category, image_path,
+                                   DATE_FORMAT(date, '%Y-%m-%d'),
+                                   IF(published, '1', '0'),
+                                   COALESCE(sort_order, 0)), 256),
+    updated_at = updated_at;
+
+SELECT 'Migration 005 applied: content hashes added and filled' AS status;
@@ -0,0 +1,38 @@
+-- ============================================
+-- Migration 006: Move post content into its own table
+-- blog_posts keeps the small metadata columns; the LONGTEXT body moves to
+-- blog_post_bodies and is joined only when a single post or a build needs it.
+-- Run with: mysql -u root -p FCS3 < migrations/006_post_bodies.sql
+-- Back up the database first - this drops blog_posts.content.
+-- ============================================
+
+USE FCS3;
+
+CREATE TABLE IF NOT EXISTS blog_post_bodies (
+    post_id INT NOT NULL PRIMARY KEY,
+    content LONGTEXT NOT NULL,
+    
+    CONSTRAINT fk_post_bodies_post FOREIGN KEY (post_id) REFERENCES blog_posts (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Optional: store bodies compressed (requires innodb_file_per_table, on by default)
+-- ALTER TABLE blog_post_bodies ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8;
+
+INSERT INTO blog_post_bodies (post_id, content)
+SELECT id, content FROM blog_posts;
+
+-- Build the body index after the bulk copy (much faster than maintaining it row by row)
+ALTER TABLE blog_post_bodies
+    ADD FULLTEXT INDEX ft_post_bodies (content);
+
+-- Only drop the old column once every body has been copied
+ALTER TABLE blog_posts
+    DROP INDEX ft_posts;
+
+ALTER TABLE blog_posts
+    DROP COLUMN content,
+    ADD FULLTEXT INDEX ft_posts (title, excerpt);
+
+OPTIMIZE TABLE blog_posts;
+
+SELECT 'Migration 006 applied: post bodies moved to blog_post_bodies' AS status;
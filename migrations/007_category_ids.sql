@@ -0,0 +1,50 @@
+-- ============================================
+-- Migration 007: Posts reference categories by id
+-- Replaces blog_posts.category (free text) with category_id, a foreign key
+-- to categories, and moves the post counters from category_stats onto the
+-- categories rows.
+-- Run with: mysql -u root -p FCS3 < migrations/007_category_ids.sql
+-- Back up the database first - this drops blog_posts.category and category_stats.
+-- ============================================
+
+USE FCS3;
+
+ALTER TABLE categories
+    ADD COLUMN published_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN draft_count INT NOT NULL DEFAULT 0;
+
+-- Every category name used by a post becomes a categories row
+INSERT IGNORE INTO categories (name)
+SELECT DISTINCT category FROM blog_posts;
+
+ALTER TABLE blog_posts
+    ADD COLUMN category_id INT NULL AFTER excerpt;
+
+UPDATE blog_posts
+JOIN categories ON categories.name = blog_posts.category
+SET blog_posts.category_id = categories.id;
+
+ALTER TABLE blog_posts
+    DROP INDEX idx_category_listing,
+    DROP INDEX idx_category_date,
+    DROP INDEX idx_published_category,
+    DROP COLUMN category,
+    MODIFY COLUMN category_id INT NOT NULL,
+    ADD INDEX idx_category_listing (category_id, published, date, sort_order, id),
+    ADD INDEX idx_category_date (category_id, date, sort_order, id),
+    ADD CONSTRAINT fk_posts_category FOREIGN KEY (category_id) REFERENCES categories (id);
+
+-- Fill the counters from existing posts
+UPDATE categories
+LEFT JOIN (
+    SELECT category_id, SUM(published = TRUE) AS published_count,
+           SUM(published = FALSE) AS draft_count
+    FROM blog_posts
+    GROUP BY category_id
+) AS counts ON counts.category_id = categories.id
+SET categories.published_count = COALESCE(counts.published_count, 0),
+    categories.draft_count = COALESCE(counts.draft_count, 0);
+
+DROP TABLE IF EXISTS category_stats;
+
+SELECT 'Migration 007 applied: posts now reference categories by id' AS status;
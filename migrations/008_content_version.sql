@@ -0,0 +1,18 @@
+-- ============================================
+-- Migration 008: Content version stamp
+-- Adds the single-row counter DatabaseManager bumps after every write.
+-- Apps read it with one primary-key lookup and only refetch posts and
+-- settings when it has moved.
+-- Run with: mysql -u root -p FCS3 < migrations/008_content_version.sql
+-- ============================================
+
+USE FCS3;
+
+CREATE TABLE IF NOT EXISTS content_version (
+    id TINYINT UNSIGNED NOT NULL PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB;
+
+INSERT IGNORE INTO content_version (id, version) VALUES (1, 0);
+
+SELECT 'Migration 008 applied: content_version table created' AS status;
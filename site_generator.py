@@ -4,11 +4,15 @@ Generate static HTML files from database content
 """
 
 import streamlit as st
+import asyncio
+import io
 import os
 import shutil
+import zipfile
 from datetime import datetime
 from database import DatabaseManager
-from generator import SiteGenerator
+from async_database import AsyncDatabaseManager
+from generator import MANIFEST_FILENAME, SiteGenerator
 from config import SITE_CONFIG, OUTPUT_CONFIG
 
 # Page configuration
@@ -25,6 +29,12 @@ def get_db_manager():
 
 db = get_db_manager()
 
+@st.cache_resource
+def get_async_db_manager():
+    return AsyncDatabaseManager(db)
+
+adb = get_async_db_manager()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -61,12 +71,42 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Check database connection
-conn_status, conn_msg = db.test_connection()
-if not conn_status:
-    st.error(f"❌ Database Connection Error: {conn_msg}")
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_preview(content_version: int) -> dict:
+    """Everything the preview shows, loaded at once and reused by reruns until the content changes"""
+    return asyncio.run(adb.gather(
+        posts=adb.get_post_summaries(published_only=False),
+        site_config=adb.get_all_site_config(),
+        stats=adb.get_dashboard_stats(recent_limit=0)
+    ))
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def zip_output_folder(folder: str, built_at: float) -> bytes:
+    """Zip the generated site (cached until the next build changes built_at)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for root, _, files in os.walk(folder):
+            for filename in files:
+                # Leave out the build manifest
+                if filename.startswith('.'):
+                    continue
+                path = os.path.join(root, filename)
+                archive.write(path, os.path.relpath(path, folder))
+    return buffer.getvalue()
+
+# Check database connection (the content version is a single-row lookup)
+try:
+    content_version = db.get_content_version()
+except Exception as e:
+    st.error(f"❌ Database Connection Error: {e}")
     st.stop()
 
+try:
+    preview = load_preview(content_version)
+except Exception as e:
+    # Each section below reports the error
+    preview = {'posts': e, 'site_config': e, 'stats': e}
+
 # Main content
 col1, col2 = st.columns([2, 1])
 
@@ -75,7 +115,9 @@ with col1:
     
     # Get posts from database
     try:
-        all_posts = db.get_all_posts(published_only=False)
+        all_posts = preview['posts']
+        if isinstance(all_posts, Exception):
+            raise all_posts
         published_posts = [p for p in all_posts if p.get('published', True)]
         
         st.metric("Total Posts", len(all_posts))
@@ -108,7 +150,9 @@ with col2:
     
     # Site configuration - load from database with config file as fallback
     try:
-        site_config = db.get_all_site_config()
+        site_config = preview['site_config']
+        if isinstance(site_config, Exception):
+            raise site_config
         if not site_config:
             site_config = SITE_CONFIG
         else:
@@ -137,6 +181,25 @@ with col2:
     
     output_filename = st.text_input("Output Filename", value="index.html")
     
+    posts_per_page = st.number_input(
+        "Posts per Page",
+        min_value=1,
+        value=OUTPUT_CONFIG.get('posts_per_page', 12),
+        help="Cards on each index page; older posts continue on page/2.html, page/3.html, ..."
+    )
+    
+    client_search = st.checkbox(
+        "Client-side Search",
+        value=OUTPUT_CONFIG.get('client_search', True),
+        help="Adds a search box; writes posts-index.json and per-post content files that load only when searching"
+    )
+    
+    full_rebuild = st.checkbox(
+        "Full Rebuild",
+        value=False,
+        help="Re-render every page. Otherwise only pages whose posts or settings changed since the last build are written"
+    )
+    
     include_about = st.checkbox("Generate About Page", value=False)
     if include_about:
         about_content = st.text_area(
@@ -159,10 +222,20 @@ with col1:
             try:
                 with st.spinner("Generating site..."):
                     # Create generator
-                    generator = SiteGenerator(site_config)
+                    generator = SiteGenerator(site_config, posts_per_page=int(posts_per_page),
+                                              client_search=client_search)
                     
-                    # Generate index.html
-                    output_path = generator.generate_index(published_posts, output_filename)
+                    # The preview's summaries carry content hashes, so only the content of
+                    # posts whose pages have to be rendered again is loaded, a batch per query
+                    result = generator.generate_site(
+                        published_posts,
+                        output_filename,
+                        categories=sorted(set(p['category'] for p in published_posts)),
+                        content_loader=db.get_post_contents,
+                        force=full_rebuild
+                    )
+                    build = result['build']
+                    output_path = result['index']
                     
                     # Generate about page if requested
                     if include_about:
@@ -176,8 +249,10 @@ with col1:
                     <div class="success-box">
                         <h3>✅ Generation Complete!</h3>
                         <p><strong>Output location:</strong> <code>{output_path}</code></p>
-                        <p><strong>Posts included:</strong> {len(published_posts)}</p>
+                        <p><strong>Posts included:</strong> {len(published_posts)} (one page each in <code>posts/</code>)</p>
+                        <p><strong>Index pages:</strong> {len(result['pages'])}</p>
                         <p><strong>Categories:</strong> {len(set(p['category'] for p in published_posts))}</p>
+                        <p><strong>Files:</strong> {build['written']} written, {build['unchanged']} unchanged, {build['deleted']} deleted</p>
                     </div>
                     """, unsafe_allow_html=True)
                     
@@ -209,15 +284,15 @@ with col2:
 
 with col3:
     output_path = os.path.join(OUTPUT_CONFIG['output_folder'], output_filename)
-    if os.path.exists(output_path):
-        with open(output_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
+    manifest_path = os.path.join(OUTPUT_CONFIG['output_folder'], MANIFEST_FILENAME)
+    if os.path.exists(output_path) and os.path.exists(manifest_path):
+        # The site is several files (index, post pages), so it downloads as one archive
         st.download_button(
-            label="📥 Download HTML",
-            data=html_content,
-            file_name=output_filename,
-            mime="text/html"
+            label="📥 Download Site (.zip)",
+            # The manifest is saved by every build, even when the index itself was unchanged
+            data=zip_output_folder(OUTPUT_CONFIG['output_folder'], os.path.getmtime(manifest_path)),
+            file_name="site.zip",
+            mime="application/zip"
         )
 
 # Last generation info
@@ -251,7 +326,11 @@ st.markdown("""
 
 ### Output Files:
 
-- `index.html` - Main blog page with all posts
+- `index.html` - Main blog page with the newest post cards
+- `page/2.html`, `page/3.html`, ... - Older post cards, linked from the index
+- `category/<slug>/index.html` - Each category's post cards (paginated the same way)
+- `posts/<id>-<slug>.html` - One page per post with the full article
+- `posts-index.json` and `content/` - Search data, loaded only when a visitor searches (if enabled)
 - `about.html` - About page (if enabled)
 - Images should be uploaded separately to your web server
 
@@ -259,14 +338,16 @@ st.markdown("""
 
 - ✅ Only **published** posts are included in the generated site
 - ✅ Posts are sorted by date (newest first)
-- ✅ All content is embedded in the HTML (no database needed on server)
+- ✅ All content is written to static HTML files (no database needed on server)
 - ✅ The site works with just static HTML + images
-- ✅ Category filtering works client-side with JavaScript
+- ✅ Each category has its own prerendered pages (no JavaScript needed)
 
 ### Deployment:
 
 Upload these files to your web host:
 - `index.html`
+- `page/`, `category/` and `posts/` folders
+- `posts-index.json` and the `content/` folder (if search is enabled)
 - `about.html` (if created)
 - `/images/` folder with all uploaded images
 """)
@@ -279,14 +360,21 @@ st.sidebar.markdown("Generate static HTML sites from your database")
 # Database stats
 st.sidebar.markdown("### 📊 Database Stats")
 try:
-    total = db.get_post_count(published_only=False)
-    published = db.get_post_count(published_only=True)
-    st.sidebar.metric("Total Posts", total)
-    st.sidebar.metric("Published Posts", published)
-    st.sidebar.metric("Draft Posts", total - published)
+    stats = preview['stats']
+    if isinstance(stats, Exception):
+        raise stats
+    st.sidebar.metric("Total Posts", stats['total_posts'])
+    st.sidebar.metric("Published Posts", stats['published_posts'])
+    st.sidebar.metric("Draft Posts", stats['draft_posts'])
 except:
     st.sidebar.warning("Cannot load stats")
 
+query_stats = db.get_query_stats()
+if query_stats and query_stats['methods']:
+    with st.sidebar.expander("🔍 Query Stats"):
+        for name, counters in query_stats['methods'].items():
+            st.write(f"**{name}**: {counters['calls']} calls, {counters['avg_ms']} ms avg, {counters['rows']} rows")
+
 # Output folder info
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📁 Output Location")
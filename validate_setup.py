@@ -127,8 +127,12 @@ try:
     conn = db.get_connection()
     cursor = conn.cursor()
     
-    required_tables = ['blog_posts', 'categories', 'site_config']
-    cursor.execute("SHOW TABLES")
+    required_tables = ['blog_posts', 'blog_post_bodies', 'categories', 'site_config', 'deleted_posts',
+                       'content_version']
+    if db.backend.name == 'sqlite':
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    else:
+        cursor.execute("SHOW TABLES")
     existing_tables = [table[0] for table in cursor.fetchall()]
     
     all_exist = True